@@ -32,6 +32,7 @@ from .xml_editor import (
     find_in_text_map,
     get_rPr_xml,
     get_text_node_data,
+    paragraph_visible_text,
     rebuild_run_fragments,
     render_plain_wt,
 )
@@ -219,9 +220,9 @@ class CommentManager:
             p = paragraphs[ref.index - 1]
             actual = compute_paragraph_hash(p)
             if actual != ref.hash:
-                tm = build_text_map(p)
-                preview = tm.text[:80]
-                if len(tm.text) > 80:
+                text = paragraph_visible_text(p)
+                preview = text[:80]
+                if len(text) > 80:
                     preview += "..."
                 raise HashMismatchError(ref.index, ref.hash, actual, preview)
             text_map = build_text_map(p)
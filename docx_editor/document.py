@@ -6,7 +6,7 @@ and comments.
 
 import html
 import shutil
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 from typing import Literal, overload
 from xml.dom.minidom import Element
@@ -38,6 +38,7 @@ from .xml_editor import (
     _compute_section_indexes,
     build_text_map,
     compute_paragraph_hash,
+    paragraph_visible_text,
 )
 
 # Default page size for list_paragraphs / list_paragraphs_structured. Bounds
@@ -338,6 +339,30 @@ class Document:
         self._ensure_open()
         return self._revision_manager.count_matches(text)
 
+    def count_matches_many(self, texts: Iterable[str]) -> dict[str, int]:
+        """Count several search strings in one pass over the document.
+
+        Equivalent to calling :meth:`count_matches` for each text, but the
+        document is walked once however many texts are given — use it to
+        check a set of anchors for uniqueness before a batch of edits.
+
+        Args:
+            texts: Texts to search for (duplicates are counted once)
+
+        Returns:
+            Mapping of each text to its number of occurrences, in input order
+
+        Raises:
+            ValueError: If ``texts`` is a single string rather than a
+                collection of them.
+
+        Example:
+            counts = doc.count_matches_many(["Section 5", "30 days"])
+            ambiguous = [text for text, n in counts.items() if n > 1]
+        """
+        self._ensure_open()
+        return self._revision_manager.count_matches_many(texts)
+
     def _compute_new_ref(self, old_ref: str, paragraphs: list[Element] | None = None) -> str:
         """Compute a fresh paragraph reference after mutation.
 
@@ -505,9 +530,9 @@ class Document:
             if max_chars == 0:
                 result.append(f"P{i}#{h}")
                 continue
-            tm = build_text_map(p)
-            preview = tm.text[:max_chars]
-            if len(tm.text) > max_chars:
+            text = paragraph_visible_text(p)
+            preview = text[:max_chars]
+            if len(text) > max_chars:
                 preview += "..."
             result.append(f"P{i}#{h}| {preview}")
         remaining = self.paragraph_count() - last_index
@@ -596,7 +621,7 @@ class Document:
         result = []
         for i, p in self._iter_paragraph_slice(start, limit):
             h = compute_paragraph_hash(p)
-            text = build_text_map(p).text
+            text = paragraph_visible_text(p)
             result.append(ParagraphInfo(index=i, ref=f"P{i}#{h}", text=text))
         return result
 
@@ -628,7 +653,7 @@ class Document:
             raise ParagraphIndexError(index, len(paragraphs))
         p = paragraphs[index - 1]
         h = compute_paragraph_hash(p)
-        return ParagraphInfo(index=index, ref=f"P{index}#{h}", text=build_text_map(p).text)
+        return ParagraphInfo(index=index, ref=f"P{index}#{h}", text=paragraph_visible_text(p))
 
     def context(self, ref: str, window: int = 2) -> list[ParagraphInfo]:
         """Return the paragraphs surrounding ``ref``, in document order.
@@ -701,9 +726,9 @@ class Document:
         p = paragraphs[parsed.index - 1]
         actual_hash = compute_paragraph_hash(p)
         if actual_hash != parsed.hash:
-            tm = build_text_map(p)
-            preview = tm.text[:80]
-            if len(tm.text) > 80:
+            text = paragraph_visible_text(p)
+            preview = text[:80]
+            if len(text) > 80:
                 preview += "..."
             raise HashMismatchError(parsed.index, parsed.hash, actual_hash, preview)
         return parsed.index, paragraphs
@@ -879,11 +904,7 @@ class Document:
         """
         self._ensure_open()
         paragraphs = self._document_editor.dom.getElementsByTagName("w:p")
-        parts = []
-        for p in paragraphs:
-            tm = build_text_map(p)
-            parts.append(tm.text)
-        return "\n".join(parts)
+        return "\n".join(paragraph_visible_text(p) for p in paragraphs)
 
     def get_original_text(self) -> str:
         """Get the original (pre-revision) text of the document.
@@ -1491,6 +1512,48 @@ class Document:
         self._ensure_open()
         return self._revision_manager.reject_revision(revision_id)
 
+    def accept_revisions(self, revision_ids: Iterable[int]) -> int:
+        """Accept several revisions by ID.
+
+        Equivalent to calling :meth:`accept_revision` for each id, but the
+        document is indexed once for the whole list instead of searched once
+        per id. Ids are processed highest first, and nested revisions are
+        resolved whatever order they are listed in.
+
+        Args:
+            revision_ids: IDs of the revisions to accept
+
+        Returns:
+            Number of revisions accepted. Ids that are not found (or were
+            already resolved) are skipped and not counted.
+
+        Example:
+            ids = [r.id for r in doc.list_revisions(author="Alice")]
+            doc.accept_revisions(ids)
+        """
+        self._ensure_open()
+        return self._revision_manager.accept_revisions(revision_ids)
+
+    def reject_revisions(self, revision_ids: Iterable[int]) -> int:
+        """Reject several revisions by ID.
+
+        The counterpart of :meth:`accept_revisions`: equivalent to calling
+        :meth:`reject_revision` for each id, with one document index for the
+        whole list.
+
+        Args:
+            revision_ids: IDs of the revisions to reject
+
+        Returns:
+            Number of revisions rejected. Ids that are not found (or were
+            already resolved) are skipped and not counted.
+
+        Example:
+            doc.reject_revisions([3, 7, 12])
+        """
+        self._ensure_open()
+        return self._revision_manager.reject_revisions(revision_ids)
+
     def accept_group(self, group_id: int) -> int:
         """Accept every revision created by one logical edit operation.
 
@@ -5,11 +5,13 @@ Provides RevisionManager for creating and managing tracked changes (insertions/d
 
 import difflib
 import re
-from collections import OrderedDict
+from collections import Counter, OrderedDict
 from collections.abc import Callable, Iterable, Iterator
 from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime
+from itertools import groupby
+from operator import attrgetter
 from typing import Literal
 from xml.dom.minidom import Element
 
@@ -34,10 +36,13 @@ from .xml_editor import (
     build_text_map,
     compute_paragraph_hash,
     compute_text_hash,
+    count_in_text,
     count_in_text_map,
     find_in_text_map,
     get_rPr_xml,
     get_text_node_data,
+    iter_elements,
+    paragraph_visible_text,
     rebuild_run_fragments,
     render_plain_wt,
 )
@@ -496,12 +501,14 @@ def _revision_elements(root) -> list[Element]:
     return elems
 
 
-def _insertion_text_nodes(elem) -> list:
-    """All <w:t>/<w:delText> descendants of a <w:ins>, in document order.
+def _revision_text_nodes(elem) -> list:
+    """All <w:t>/<w:delText> descendants of a <w:ins>/<w:del>, in document order.
 
-    Including <w:delText> means a host insertion whose content was later
-    deleted by a nested <w:del> still reports the full text it originally
-    inserted (plain <w:delText> never appears under <w:ins> otherwise).
+    For a <w:ins>, including <w:delText> means a host insertion whose content
+    was later deleted by a nested <w:del> still reports the full text it
+    originally inserted (plain <w:delText> never appears under <w:ins>
+    otherwise). A <w:del> picks its text out of the same single walk — see
+    _parse_revision.
     """
     nodes: list = []
 
@@ -543,6 +550,53 @@ def _next_element_sibling(node) -> Element | None:
     return node
 
 
+def _node_spans(positions: list[TextPosition]) -> list[tuple[object, int, int]]:
+    """Collapse per-character ``positions`` into ``(w:t node, first offset, last offset)`` spans.
+
+    A match's positions are in document order, so each node's characters
+    are contiguous: ``groupby`` splits the list at node changes without a
+    per-character Python loop body, and the edit paths then work on one
+    span per node.
+    """
+    spans = []
+    for node, group in groupby(positions, key=attrgetter("node")):
+        chars = list(group)
+        spans.append((node, chars[0].offset_in_node, chars[-1].offset_in_node))
+    return spans
+
+
+def _whole_single_text_run(parts: list[tuple[Element, str, str, str, str, int]]) -> Element | None:
+    """The run, if ``parts`` covers the entire text of one run holding a single ``w:t``.
+
+    Such a run (an optional ``w:rPr`` aside) can be marked deleted in place
+    — its ``w:t`` becomes ``w:delText`` under a new ``w:del`` — instead of
+    being rebuilt from a reparsed fragment.
+    """
+    if len(parts) != 1:
+        return None
+    run, _, before, _, after, _ = parts[0]
+    if before or after:
+        return None
+    content = [c for c in run.childNodes if c.nodeType == c.ELEMENT_NODE and c.tagName != "w:rPr"]
+    if len(content) == 1 and content[0].tagName == "w:t":
+        return run
+    return None
+
+
+def _new_revision_id(nodes, tag: str) -> int:
+    """``w:id`` of the first top-level ``tag`` element among freshly inserted ``nodes``, else -1.
+
+    ``nodes`` is what ``insert_before``/``insert_after``/``replace_node``/
+    ``append_to`` return — the fragment's top-level nodes, already stamped by
+    attribute injection — so this reads the id assigned during insertion
+    without searching the document.
+    """
+    for node in nodes:
+        if node.nodeType == node.ELEMENT_NODE and node.tagName == tag:
+            return int(node.getAttribute("w:id"))
+    return -1
+
+
 def _paragraph_mark_ins(paragraph) -> Element | None:
     """The paragraph-mark insertion of ``paragraph``: the ``<w:ins>`` marker
     inside ``<w:pPr><w:rPr>`` that flags this paragraph's mark as an inserted
@@ -1055,9 +1109,9 @@ class RevisionManager:
         p = paragraphs[ref.index - 1]
         actual_hash = compute_paragraph_hash(p)
         if actual_hash != ref.hash:
-            tm = build_text_map(p)
-            preview = tm.text[:80]
-            if len(tm.text) > 80:
+            text = paragraph_visible_text(p)
+            preview = text[:80]
+            if len(text) > 80:
                 preview += "..."
             raise HashMismatchError(ref.index, ref.hash, actual_hash, preview)
         return p
@@ -1611,11 +1665,11 @@ class RevisionManager:
             ins_ancestor = self._find_ancestor(run, "w:ins")
             if ins_ancestor:
                 if self._owns_ins(ins_ancestor):
-                    node_text = self._get_node_text(last_pos.node)
+                    node_text = get_text_node_data(last_pos.node)
                     self._set_node_text(last_pos.node, node_text + text)
                     _set_xml_space_preserve(last_pos.node)
                 else:
-                    node_text = self._get_node_text(last_pos.node)
+                    node_text = get_text_node_data(last_pos.node)
                     self._insert_own_ins_within_foreign_ins(ins_ancestor, last_pos.node, len(node_text), text, rPr_xml)
                 return
 
@@ -1634,7 +1688,7 @@ class RevisionManager:
         ins_ancestor = self._find_ancestor(run, "w:ins")
         if ins_ancestor:
             if self._owns_ins(ins_ancestor):
-                node_text = self._get_node_text(pos.node)
+                node_text = get_text_node_data(pos.node)
                 offset = pos.offset_in_node
                 self._set_node_text(pos.node, node_text[:offset] + text + node_text[offset:])
                 _set_xml_space_preserve(pos.node)
@@ -1643,7 +1697,7 @@ class RevisionManager:
             return
 
         # Split the run at the offset and insert <w:ins> between
-        node_text = self._get_node_text(pos.node)
+        node_text = get_text_node_data(pos.node)
         offset = pos.offset_in_node
         before_text = node_text[:offset]
         after_text = node_text[offset:]
@@ -1661,7 +1715,8 @@ class RevisionManager:
     def count_matches(self, text: str) -> int:
         """Count how many times a text string appears in the document.
 
-        Uses text maps for accurate counting across element boundaries.
+        Counts across element boundaries on each paragraph's visible text
+        (the text-map text, without building the per-character map).
 
         Args:
             text: Text to search for
@@ -1671,9 +1726,35 @@ class RevisionManager:
         """
         count = 0
         for paragraph in self.editor.dom.getElementsByTagName("w:p"):
-            count += count_in_text_map(build_text_map(paragraph), text)
+            count += count_in_text(paragraph_visible_text(paragraph), text)
         return count
 
+    def count_matches_many(self, texts: Iterable[str]) -> dict[str, int]:
+        """Count several search strings in one pass over the document.
+
+        Same per-paragraph semantics as :meth:`count_matches`, but each
+        paragraph's visible text is computed once and shared by every needle
+        instead of once per needle.
+
+        Args:
+            texts: Texts to search for (duplicates are counted once)
+
+        Returns:
+            Mapping of each text to its number of occurrences, in input order
+
+        Raises:
+            ValueError: If ``texts`` is a single string rather than a
+                collection of them.
+        """
+        if isinstance(texts, str):
+            raise ValueError(f"count_matches_many(): expected a collection of strings, got the string {texts!r}")
+        counts = dict.fromkeys(texts, 0)
+        for paragraph in self.editor.dom.getElementsByTagName("w:p"):
+            visible = paragraph_visible_text(paragraph)
+            for text in counts:
+                counts[text] += count_in_text(visible, text)
+        return counts
+
     def _locate_document_wide(self, text: str, occurrence: int | None = None) -> TextMapMatch:
         """Document-wide nth-occurrence lookup via text maps.
 
@@ -1709,29 +1790,35 @@ class RevisionManager:
     def _find_across_boundaries_located(self, text: str, occurrence: int = 0) -> _LocatedMatch | None:
         """Find the nth occurrence of text across element boundaries.
 
-        Searches across all paragraphs using text maps, keeping paragraph
-        identity so callers can build hash-anchored refs.
+        Searches across all paragraphs, keeping paragraph identity so callers
+        can build hash-anchored refs. Occurrences are counted on each
+        paragraph's visible text; the text map is built only for the one
+        paragraph holding the requested occurrence.
 
         Returns:
             A _LocatedMatch, or None if not found.
         """
         current_occurrence = 0
         for idx, paragraph in enumerate(self.editor.dom.getElementsByTagName("w:p"), start=1):
-            text_map = build_text_map(paragraph)
-            local_occ = 0
-            while True:
-                match = find_in_text_map(text_map, text, local_occ)
-                if match is None:
-                    break
-                if current_occurrence == occurrence:
-                    return _LocatedMatch(
-                        match=match,
-                        paragraph_index=idx,
-                        paragraph=paragraph,
-                        paragraph_occurrence=local_occ,
-                    )
-                current_occurrence += 1
-                local_occ += 1
+            local_total = count_in_text(paragraph_visible_text(paragraph), text)
+            if current_occurrence + local_total <= occurrence:
+                current_occurrence += local_total
+                continue
+            local_occ = occurrence - current_occurrence
+            match = find_in_text_map(build_text_map(paragraph), text, local_occ)
+            if match is None:
+                # Both passes read the same accepted-view text with the same
+                # overlapping advance, so a miss here means they diverged.
+                raise RuntimeError(
+                    f"paragraph {idx}: visible text counts {local_total} match(es) of {text!r} "
+                    f"but its text map has no occurrence {local_occ}"
+                )
+            return _LocatedMatch(
+                match=match,
+                paragraph_index=idx,
+                paragraph=paragraph,
+                paragraph_occurrence=local_occ,
+            )
         return None
 
     def _find_across_boundaries(self, text: str, occurrence: int = 0) -> TextMapMatch | None:
@@ -1814,12 +1901,16 @@ class RevisionManager:
 
         results: list[SearchResult] = []
         for idx, p in paragraphs:
+            visible = paragraph_visible_text(p)
+            if text not in visible:
+                continue
             text_map = build_text_map(p)
             paragraph_ref: str | None = None
             local_occ = 0
             while (match := find_in_text_map(text_map, text, local_occ)) is not None:
                 if paragraph_ref is None:
-                    paragraph_ref = f"P{idx}#{compute_paragraph_hash(p)}"
+                    # The hash is over the same visible text; don't walk p again.
+                    paragraph_ref = f"P{idx}#{compute_text_hash(visible)}"
                 results.append(
                     SearchResult(
                         start=match.start,
@@ -1920,21 +2011,11 @@ class RevisionManager:
 
     def _get_run_info(self, node) -> tuple[Element | None, str]:
         """Get the parent w:r element and its rPr XML for a w:t node."""
-        run = node.parentNode
-        while run and run.nodeName != "w:r":
-            run = run.parentNode
+        run = self._find_ancestor(node, "w:r")
         if not run:
             return None, ""
         return run, get_rPr_xml(run)
 
-    def _get_node_text(self, node) -> str:
-        """Get text content of a w:t node by concatenating ALL child text nodes.
-
-        Thin wrapper around :func:`get_text_node_data` — kept as a method so
-        existing call sites (and external subclasses) don't have to change.
-        """
-        return get_text_node_data(node)
-
     def _set_node_text(self, node, text: str) -> None:
         """Replace all text content of a w:t/w:delText element with ``text``.
 
@@ -1954,33 +2035,18 @@ class RevisionManager:
         Returns list of (run, rPr_xml, before_text, matched_part, after_text, node_id) tuples,
         one per unique w:t node involved in the match. Nodes are in document order.
         """
-        # Group positions by their w:t node (not run — a run can have multiple w:t nodes)
-        node_data = OrderedDict()
-        for pos in match.positions:
-            run, rPr_xml = self._get_run_info(pos.node)
+        # One span per w:t node (not run — a run can have multiple w:t nodes);
+        # the run and its rPr are looked up once per node.
+        result = []
+        for node, first, last in _node_spans(match.positions):
+            run, rPr_xml = self._get_run_info(node)
             if run is None:
                 continue
-            nid = id(pos.node)
-            if nid not in node_data:
-                node_data[nid] = {
-                    "run": run,
-                    "rPr_xml": rPr_xml,
-                    "node": pos.node,
-                    "first_offset": pos.offset_in_node,
-                    "last_offset": pos.offset_in_node,
-                }
-            else:
-                node_data[nid]["last_offset"] = pos.offset_in_node
-
-        result = []
-        for nid, info in node_data.items():
-            node_text = self._get_node_text(info["node"])
-            first = info["first_offset"]
-            last = info["last_offset"]
+            node_text = get_text_node_data(node)
             before = node_text[:first]
             matched = node_text[first : last + 1]
             after = node_text[last + 1 :]
-            result.append((info["run"], info["rPr_xml"], before, matched, after, nid))
+            result.append((run, rPr_xml, before, matched, after, id(node)))
         return result
 
     def _majority_rPr(self, parts: list[tuple[Element, str, str, str, str, int]]) -> str:
@@ -2098,9 +2164,7 @@ class RevisionManager:
                     # The wrapper is a new revision holding this operation's
                     # replacement text — return its id so the caller's
                     # EditResult reaches the group that contains it.
-                    for node in new_nodes:
-                        if node.nodeType == node.ELEMENT_NODE and node.tagName == "w:ins":  # pragma: no branch
-                            return int(node.getAttribute("w:id"))
+                    return _new_revision_id(new_nodes, "w:ins")
                 # Reached by the splice-in-place branch: no new revision.
                 return -1
 
@@ -2119,15 +2183,22 @@ class RevisionManager:
                 new_nodes = self.editor.insert_after(del_ins, replacement_xml)
             else:  # pragma: no cover - Site D positions are inside ins, so the del is nested
                 new_nodes = self.editor.insert_after(last_del, replacement_xml)
-            for node in new_nodes:
-                if node.nodeType == node.ELEMENT_NODE and node.tagName == "w:ins":  # pragma: no branch
-                    return int(node.getAttribute("w:id"))
-            return first_id  # pragma: no cover - the fragment always yields a w:ins
+            return _new_revision_id(new_nodes, "w:ins")
 
         # The insertion carries the rPr covering the most characters of the
         # match (same-rPr runs tally together; ties → earliest seen)
         ins_rPr = self._majority_rPr(parts)
 
+        # Fast path: the match is one whole single-text run — mark it deleted
+        # in place and add the replacement after it
+        whole_run = _whole_single_text_run(parts)
+        if whole_run is not None:
+            del_elem = self.editor.suggest_deletion(whole_run)
+            nodes = self.editor.insert_after(
+                del_elem, f"<w:ins><w:r>{ins_rPr}<w:t>{_escape_xml(replace_with)}</w:t></w:r></w:ins>"
+            )
+            return _new_revision_id(nodes, "w:ins")
+
         # Group parts by run for multi-w:t preservation
         run_order: list[int] = []
         run_map: dict[int, dict] = {}
@@ -2194,12 +2265,7 @@ class RevisionManager:
             if parent:
                 parent.removeChild(run)
 
-        # Find insertion node ID
-        for node in nodes:
-            if node.nodeType == node.ELEMENT_NODE and node.tagName == "w:ins":
-                return int(node.getAttribute("w:id"))
-
-        return -1
+        return _new_revision_id(nodes, "w:ins")
 
     def _replace_mixed_state(self, match: TextMapMatch, replace_with: str) -> int:
         """Replace text spanning revision boundaries via atomic decomposition.
@@ -2268,10 +2334,7 @@ class RevisionManager:
             marker.parentNode.removeChild(marker)
 
         # Return the change ID of the new insertion
-        for node in new_nodes:
-            if node.nodeType == node.ELEMENT_NODE and node.tagName == "w:ins":
-                return int(node.getAttribute("w:id"))
-        return -1
+        return _new_revision_id(new_nodes, "w:ins")
 
     def _find_ancestor(self, node, tag_name: str) -> Element | None:
         """Find the nearest ancestor with the given tag name."""
@@ -2318,8 +2381,12 @@ class RevisionManager:
         """
         groups: list[tuple[Element | None, list[TextPosition]]] = []
         current_ins = None
+        last_node = ins_elem = None
         for pos in positions:
-            ins_elem = self._find_ancestor(pos.node, "w:ins")
+            # Consecutive positions share a w:t node; walk up once per node.
+            if pos.node is not last_node:
+                last_node = pos.node
+                ins_elem = self._find_ancestor(pos.node, "w:ins")
             if not groups or ins_elem is not current_ins:
                 groups.append((ins_elem, [pos]))
                 current_ins = ins_elem
@@ -2392,7 +2459,7 @@ class RevisionManager:
         run, rPr_xml = self._get_run_info(edge_node)
         if not run:  # pragma: no cover - a w:t node always sits inside a run
             return None
-        node_text = self._get_node_text(edge_node)
+        node_text = get_text_node_data(edge_node)
 
         # This site splits a run into left/right halves rather than rendering
         # per-w:t, and must know which side each child lands on, so it keeps
@@ -2416,7 +2483,7 @@ class RevisionManager:
                 side = right_parts
                 continue
             if tag == "w:t":
-                wt_text = self._get_node_text(child)
+                wt_text = get_text_node_data(child)
                 if wt_text:
                     side.append(f"<w:r>{rPr_xml}<w:t>{_escape_xml(wt_text)}</w:t></w:r>")
                 continue
@@ -2452,7 +2519,7 @@ class RevisionManager:
         """
         own_ins_xml = f"<w:ins><w:r>{rPr_xml}<w:t>{_escape_xml(text)}</w:t></w:r></w:ins>"
         wt_nodes = self._get_wt_nodes_in_ancestor(ins_elem)
-        node_text = self._get_node_text(edge_node)
+        node_text = get_text_node_data(edge_node)
 
         if edge_node is wt_nodes[0] and offset == 0:
             new_nodes = self.editor.insert_before(ins_elem, own_ins_xml)
@@ -2466,10 +2533,7 @@ class RevisionManager:
                 self._split_ins_after_child(ins_elem, boundary)
                 new_nodes = self.editor.insert_after(ins_elem, own_ins_xml)
 
-        for node in new_nodes:
-            if node.nodeType == node.ELEMENT_NODE and node.tagName == "w:ins":  # pragma: no branch
-                return int(node.getAttribute("w:id"))
-        return -1  # pragma: no cover - the fragment always yields a w:ins
+        return _new_revision_id(new_nodes, "w:ins")
 
     def _remove_from_insertion(self, positions: list) -> None:
         """Remove matched text from inside a <w:ins> element.
@@ -2478,26 +2542,13 @@ class RevisionManager:
         If the entire insertion text is matched, removes the <w:ins> element.
         If partial, truncates or splits.
         """
-        # Group positions by w:t node to handle multi-node segments
-        node_groups = OrderedDict()
-        for pos in positions:
-            nid = id(pos.node)
-            if nid not in node_groups:
-                node_groups[nid] = {"node": pos.node, "first": pos.offset_in_node, "last": pos.offset_in_node}
-            else:
-                node_groups[nid]["last"] = pos.offset_in_node
-
-        groups = list(node_groups.values())
-        first_group = groups[0]
-        last_group = groups[-1]
-
-        first_node = first_group["node"]
-        last_node = last_group["node"]
-        first_offset = first_group["first"]
-        last_offset = last_group["last"]
+        # One span per w:t node to handle multi-node segments
+        groups = _node_spans(positions)
+        first_node, first_offset, _ = groups[0]
+        last_node, _, last_offset = groups[-1]
 
-        before = self._get_node_text(first_node)[:first_offset]
-        after = self._get_node_text(last_node)[last_offset + 1 :]
+        before = get_text_node_data(first_node)[:first_offset]
+        after = get_text_node_data(last_node)[last_offset + 1 :]
 
         ins_elem = self._find_ancestor(first_node, "w:ins")
 
@@ -2507,7 +2558,7 @@ class RevisionManager:
                 ins_elem.parentNode.removeChild(ins_elem)
         elif len(groups) == 1 and first_node is last_node:
             # Single node — use simple truncate/split logic
-            node_text = self._get_node_text(first_node)
+            node_text = get_text_node_data(first_node)
             before_text = node_text[:first_offset]
             after_text = node_text[last_offset + 1 :]
 
@@ -2553,8 +2604,8 @@ class RevisionManager:
                 self._remove_wt_and_maybe_run(last_node)
 
             # Remove intermediate nodes unconditionally (entire text is matched)
-            for group in groups[1:-1]:
-                self._remove_wt_and_maybe_run(group["node"])
+            for node, _, _ in groups[1:-1]:
+                self._remove_wt_and_maybe_run(node)
 
     def _remove_wt_and_maybe_run(self, wt_node) -> None:
         """Remove a w:t node, and its parent w:r if no meaningful children remain.
@@ -2591,87 +2642,86 @@ class RevisionManager:
 
         Returns (first created del id or -1, last created del element or None).
         """
-        # Group positions by run, then by node within each run
+        # Group node spans by run. The run and its rPr are looked up once per
+        # node, not once per character.
         run_groups: OrderedDict[int, dict] = OrderedDict()
-        for pos in positions:
-            run, rPr_xml = self._get_run_info(pos.node)
+        for node, first, last in _node_spans(positions):
+            run, rPr_xml = self._get_run_info(node)
             if not run:
                 continue
             rid = id(run)
             if rid not in run_groups:
                 run_groups[rid] = {"run": run, "rPr_xml": rPr_xml, "nodes": OrderedDict()}
-            nid = id(pos.node)
-            node_map = run_groups[rid]["nodes"]
-            if nid not in node_map:
-                node_map[nid] = {"node": pos.node, "first": pos.offset_in_node, "last": pos.offset_in_node}
-            else:
-                node_map[nid]["last"] = pos.offset_in_node
+            run_groups[rid]["nodes"][id(node)] = {"node": node, "first": first, "last": last}
 
-        # Flatten to a list of (run_info, node_group) for global indexing
-        all_node_groups: list[tuple[dict, dict]] = []
+        # Global position of each node group in match order, so the renderer
+        # knows which one carries the leading/trailing unmatched text.
+        global_pos: dict[int, int] = {}
         for run_info in run_groups.values():
             for ng in run_info["nodes"].values():
-                all_node_groups.append((run_info, ng))
+                global_pos[id(ng)] = len(global_pos)
+        total = len(global_pos)
+
+        # Adjacent sibling runs are rebuilt as one fragment, so each stretch
+        # is parsed and inserted once instead of once per run.
+        batches: list[list[dict]] = []
+        for run_info in run_groups.values():
+            if batches and batches[-1][-1]["run"].nextSibling is run_info["run"]:
+                batches[-1].append(run_info)
+            else:
+                batches.append([run_info])
 
-        total = len(all_node_groups)
         first_del_id = -1
         last_del: Element | None = None
-        processed_runs: set[int] = set()
-
-        for _global_idx, (run_info, _) in enumerate(all_node_groups):
-            run = run_info["run"]
-            rPr_xml = run_info["rPr_xml"]
-            rid = id(run)
-
-            if rid in processed_runs:
-                continue
 
-            node_items = list(run_info["nodes"].values())
+        for batch in batches:
+            new_xml_parts: list[str] = []
+            for run_info in batch:
+                rPr_xml = run_info["rPr_xml"]
+
+                # Render ALL w:t nodes in this run, preserving unmatched ones.
+                # Keyword-only defaults bind this iteration's state (B023).
+                def render_wt(wt, *, run_info=run_info, run_rPr=rPr_xml) -> list[str]:
+                    fragments: list[str] = []
+                    if id(wt) not in run_info["nodes"]:
+                        # Unmatched sibling — preserve as-is
+                        return render_plain_wt(wt, run_rPr)
+
+                    ng = run_info["nodes"][id(wt)]
+                    node_text = get_text_node_data(ng["node"])
+                    first_offset = ng["first"]
+                    last_offset = ng["last"]
+
+                    is_first_overall = global_pos[id(ng)] == 0
+                    is_last_overall = global_pos[id(ng)] == total - 1
+
+                    before = node_text[:first_offset] if is_first_overall else ""
+                    after = node_text[last_offset + 1 :] if is_last_overall else ""
+
+                    # For intermediate nodes, the entire text is matched
+                    if not is_first_overall and not is_last_overall:
+                        matched = node_text
+                    else:
+                        matched = node_text[first_offset : last_offset + 1]
 
-            # Render ALL w:t nodes in this run, preserving unmatched ones.
-            # Keyword-only defaults bind this iteration's state (B023).
-            def render_wt(wt, *, run_info=run_info, run_rPr=rPr_xml, node_items=node_items, rid=rid) -> list[str]:
-                fragments: list[str] = []
-                if id(wt) not in run_info["nodes"]:
-                    # Unmatched sibling — preserve as-is
-                    return render_plain_wt(wt, run_rPr)
-
-                ng = run_info["nodes"][id(wt)]
-                node_text = self._get_node_text(ng["node"])
-                first_offset = ng["first"]
-                last_offset = ng["last"]
-
-                # Determine this node group's position in the global sequence
-                run_keys = list(run_groups.keys())
-                local_idx = node_items.index(ng)
-                preceding_nodes = sum(len(run_groups[k]["nodes"]) for k in run_keys[: run_keys.index(rid)])
-                global_pos = preceding_nodes + local_idx
-                is_first_overall = global_pos == 0
-                is_last_overall = global_pos == total - 1
-
-                before = node_text[:first_offset] if is_first_overall else ""
-                after = node_text[last_offset + 1 :] if is_last_overall else ""
-
-                # For intermediate nodes, the entire text is matched
-                if not is_first_overall and not is_last_overall:
-                    matched = node_text
-                else:
-                    matched = node_text[first_offset : last_offset + 1]
+                    if before:
+                        fragments.append(f"<w:r>{run_rPr}<w:t>{_escape_xml(before)}</w:t></w:r>")
+                    fragments.append(
+                        f"<w:del><w:r>{run_rPr}<w:delText>{_escape_xml(matched)}</w:delText></w:r></w:del>"
+                    )
+                    if after:
+                        fragments.append(f"<w:r>{run_rPr}<w:t>{_escape_xml(after)}</w:t></w:r>")
+                    return fragments
 
-                if before:
-                    fragments.append(f"<w:r>{run_rPr}<w:t>{_escape_xml(before)}</w:t></w:r>")
-                fragments.append(f"<w:del><w:r>{run_rPr}<w:delText>{_escape_xml(matched)}</w:delText></w:r></w:del>")
-                if after:
-                    fragments.append(f"<w:r>{run_rPr}<w:t>{_escape_xml(after)}</w:t></w:r>")
-                return fragments
+                # Emit the run's children in document order (w:tab/w:br/w:drawing/…
+                # preserved in place)
+                new_xml_parts.extend(rebuild_run_fragments(run_info["run"], rPr_xml, render_wt))
 
-            # Emit the run's children in document order (w:tab/w:br/w:drawing/…
-            # preserved in place)
-            new_xml = "".join(rebuild_run_fragments(run, rPr_xml, render_wt))
-            nodes = self.editor.insert_before(run, new_xml)
-            if run.parentNode:
-                run.parentNode.removeChild(run)
-            processed_runs.add(rid)
+            nodes = self.editor.insert_before(batch[0]["run"], "".join(new_xml_parts))
+            for run_info in batch:
+                run = run_info["run"]
+                if run.parentNode:
+                    run.parentNode.removeChild(run)
 
             for n in nodes:
                 if n.nodeType == n.ELEMENT_NODE and n.tagName == "w:del":
@@ -2699,6 +2749,11 @@ class RevisionManager:
             first_id, _ = self._delete_from_ins_positions(match.positions)
             return first_id
 
+        # Fast path: the match is one whole single-text run — mark it deleted in place
+        whole_run = _whole_single_text_run(parts)
+        if whole_run is not None:
+            return int(self.editor.suggest_deletion(whole_run).getAttribute("w:id"))
+
         # Group parts by run, using node ids from _build_cross_boundary_parts
         run_parts: OrderedDict[int, list] = OrderedDict()
         for part in parts:
@@ -2747,12 +2802,7 @@ class RevisionManager:
             if parent:
                 parent.removeChild(run)
 
-        # Find deletion node ID
-        for node in nodes:
-            if node.nodeType == node.ELEMENT_NODE and node.tagName == "w:del":
-                return int(node.getAttribute("w:id"))
-
-        return -1
+        return _new_revision_id(nodes, "w:del")
 
     def _delete_mixed_state(self, match: TextMapMatch) -> int:
         """Delete text spanning revision boundaries.
@@ -2877,7 +2927,7 @@ class RevisionManager:
         ins_ancestor = self._find_ancestor(run, "w:ins")
         if ins_ancestor:
             if self._owns_ins(ins_ancestor):
-                node_text = self._get_node_text(edge.node)
+                node_text = get_text_node_data(edge.node)
                 self._set_node_text(edge.node, node_text[:offset] + text + node_text[offset:])
                 _set_xml_space_preserve(edge.node)
                 return -1
@@ -2890,7 +2940,7 @@ class RevisionManager:
         def render_wt(wt) -> list[str]:
             fragments: list[str] = []
             if wt is edge.node:
-                node_text = self._get_node_text(wt)
+                node_text = get_text_node_data(wt)
                 before_text = node_text[:offset]
                 after_text = node_text[offset:]
                 if before_text:
@@ -2904,11 +2954,7 @@ class RevisionManager:
             return fragments
 
         nodes = self.editor.replace_node(run, "".join(rebuild_run_fragments(run, rPr_xml, render_wt)))
-
-        for node in nodes:
-            if node.nodeType == node.ELEMENT_NODE and node.tagName == "w:ins":
-                return int(node.getAttribute("w:id"))
-        return -1
+        return _new_revision_id(nodes, "w:ins")
 
     # ==================== Paragraph splits (\n) ====================
 
@@ -3212,26 +3258,26 @@ class RevisionManager:
         def matches(rev: Revision | None) -> bool:
             if rev is None:
                 return False
-            if author is not None and rev.author != author:
-                return False
             return paragraph_filter is None or rev.paragraph_ref == paragraph_filter
 
         revisions = []
 
-        # Find all insertions
-        for ins_elem in self.editor.dom.getElementsByTagName("w:ins"):
-            rev = self._parse_revision(ins_elem, "insertion", ctx)
-            if matches(rev):
-                revisions.append(rev)
-
-        # Find all deletions
-        for del_elem in self.editor.dom.getElementsByTagName("w:del"):
-            rev = self._parse_revision(del_elem, "deletion", ctx)
+        # One document-order walk picks up insertions and deletions together
+        for elem in _revision_elements(self.editor.dom):
+            # Filter by author before parsing: other authors' revisions never
+            # pay for the date parse, text join, or location lookup. Same
+            # "Unknown" fallback as _parse_revision.
+            if author is not None and (elem.getAttribute("w:author") or "Unknown") != author:
+                continue
+            rev_type = "insertion" if elem.tagName == "w:ins" else "deletion"
+            rev = self._parse_revision(elem, rev_type, ctx)
             if matches(rev):
                 revisions.append(rev)
 
-        # Sort by ID
-        revisions.sort(key=lambda r: r.id)
+        # Sort by the int id parsed once in _parse_revision. Document order is
+        # not id order (nested and Word-authored revisions interleave), so the
+        # sort stays; attrgetter keeps the key lookup out of Python bytecode.
+        revisions.sort(key=attrgetter("id"))
         return revisions
 
     def get_markup_text(self) -> str:
@@ -3299,17 +3345,15 @@ class RevisionManager:
             date = None
 
         # Extract text content
-        if rev_type == "insertion":
-            text_elems = _insertion_text_nodes(elem)
-        else:
-            text_elems = elem.getElementsByTagName("w:delText")
-            if not text_elems:
-                # Deliberate interop fallback: nonconforming producers may
-                # leave plain w:t inside w:del. Fires only when the w:del has
-                # no w:delText at all; mixed content reads only w:delText.
-                text_elems = elem.getElementsByTagName("w:t")
+        text_elems = _revision_text_nodes(elem)
+        if rev_type == "deletion":
+            # Deliberate interop fallback: nonconforming producers may leave
+            # plain w:t inside w:del. The w:t nodes are used only when the
+            # w:del has no w:delText at all; mixed content reads only
+            # w:delText. Both come from the one walk above.
+            text_elems = [t for t in text_elems if t.tagName == "w:delText"] or text_elems
 
-        text = "".join(self._get_node_text(t_elem) for t_elem in text_elems)
+        text = "".join(get_text_node_data(t_elem) for t_elem in text_elems)
 
         paragraph_ref = None
         occurrence = None
@@ -3342,25 +3386,14 @@ class RevisionManager:
         )
 
     def _revision_element_index(self) -> dict[str, Element]:
-        """Map ``w:id`` -> its <w:ins>/<w:del> element, one full-DOM walk per tag.
-
-        Built once per group/changeset resolution and threaded through
-        ``accept_revision``/``reject_revision`` so locating a member is an O(1)
-        lookup instead of a fresh full-document scan (ISSUES.md #57).
+        """The w:id -> element map of :meth:`_revision_index`, for ref location.
 
-        One element per id is exact for this path: a duplicate w:id never
-        becomes a group member — ``_reconstruct_groups`` bars every duplicated
-        id from every inferred group, and our own allocator keeps recorded ids
-        unique — so a member id always maps to a single element. The
-        w:ins-before-w:del insertion order only settles a tie-break group
-        members never hit (it mirrors the fresh scan, which checks insertions
-        first).
+        Edit results locate their group's paragraphs through it; group members
+        never carry a duplicated w:id (``_reconstruct_groups`` bars every
+        duplicated id from every inferred group, and our own allocator keeps
+        recorded ids unique), so the shadow flag is not needed there.
         """
-        element_index: dict[str, Element] = {}
-        for tag in ("w:ins", "w:del"):
-            for elem in self.editor.dom.getElementsByTagName(tag):
-                element_index.setdefault(elem.getAttribute("w:id"), elem)
-        return element_index
+        return self._revision_index()[1]
 
     def _is_in_document(self, elem) -> bool:
         """True if ``elem`` is still attached to the live document tree.
@@ -3384,19 +3417,25 @@ class RevisionManager:
         """Locate the live <w:ins>/<w:del> element for ``revision_id``.
 
         ``element_index is None`` scans the document fresh (insertions before
-        deletions), matching the historical lookup exactly. Otherwise the id is
-        resolved through the pre-built ``element_index`` and confirmed
-        still-attached via ``_is_in_document``.
-        """
+        deletions), matching the historical lookup exactly. The scan is one
+        lazy walk: it returns at the first matching w:ins, and otherwise falls
+        back to the first matching w:del it passed, rather than sweeping once
+        per tag. Otherwise the id is resolved through the pre-built
+        ``element_index`` and confirmed still-attached via
+        ``_is_in_document``.
+        """
+        target = str(revision_id)
         if element_index is None:
-            for ins_elem in self.editor.dom.getElementsByTagName("w:ins"):
-                if ins_elem.getAttribute("w:id") == str(revision_id):
-                    return ins_elem
-            for del_elem in self.editor.dom.getElementsByTagName("w:del"):
-                if del_elem.getAttribute("w:id") == str(revision_id):
-                    return del_elem
-            return None
-        elem = element_index.get(str(revision_id))
+            deletion = None
+            for elem in iter_elements(self.editor.dom, "*"):
+                tag = elem.tagName
+                if tag == "w:ins" or (tag == "w:del" and deletion is None):
+                    if elem.getAttribute("w:id") == target:
+                        if tag == "w:ins":
+                            return elem
+                        deletion = elem
+            return deletion
+        elem = element_index.get(target)
         if elem is None or not self._is_in_document(elem):
             return None
         return elem
@@ -3410,9 +3449,9 @@ class RevisionManager:
         Args:
             revision_id: The w:id of the revision to accept
             element_index: Optional pre-built w:id -> element map (see
-                ``_revision_element_index``) that lets group/changeset
-                resolution skip a full-DOM scan per member. ``None`` scans
-                fresh (standalone calls, accept_all/reject_all).
+                ``_revision_index``) that lets bulk resolution
+                (groups, changesets, accept_all/reject_all) skip a full-DOM
+                scan per member. ``None`` scans fresh (standalone calls).
 
         Returns:
             True if revision was accepted, False if not found
@@ -3437,9 +3476,9 @@ class RevisionManager:
         Args:
             revision_id: The w:id of the revision to reject
             element_index: Optional pre-built w:id -> element map (see
-                ``_revision_element_index``) that lets group/changeset
-                resolution skip a full-DOM scan per member. ``None`` scans
-                fresh (standalone calls, accept_all/reject_all).
+                ``_revision_index``) that lets bulk resolution
+                (groups, changesets, accept_all/reject_all) skip a full-DOM
+                scan per member. ``None`` scans fresh (standalone calls).
 
         Returns:
             True if revision was rejected, False if not found
@@ -3466,27 +3505,40 @@ class RevisionManager:
         Same reverse-id, loop-until-no-progress pattern as accept_all/
         reject_all, restricted to ``members``: nested members become
         resolvable once their host is processed, and members already resolved
-        individually are simply skipped. Shared by group and changeset
-        resolution (a changeset passes the union of its groups' revisions).
-
-        The w:id -> element index is built once here and threaded through every
-        ``resolve`` call, so resolution costs two full-DOM walks total instead
-        of one scan per member per pass (ISSUES.md #57). The index stays valid
-        across passes: accept/reject only ever *detach* elements, and
+        individually are simply skipped. Shared by group, changeset and
+        explicit id-list resolution (a changeset passes the union of its
+        groups' revisions; accept/reject_revisions pass the caller's ids).
+
+        Each listed id resolves at most as many times as it is listed — the
+        same outcome as one ``resolve`` call per entry. That only matters for
+        a w:id Word duplicated: ``list_revisions`` reports every copy, and
+        only the first is reachable through the index until it is resolved.
+
+        The w:id -> element index (``_revision_index``) is threaded through
+        every ``resolve`` call, so a pass is O(1) per member instead of one
+        full-document scan each (ISSUES.md #57). Without duplicate ids it is
+        built once: accept/reject only ever *detach* elements, and
         ``_is_in_document`` (inside ``resolve``) treats a detached member as
-        already gone.
+        already gone. With duplicates it is rebuilt after each pass that made
+        progress, exposing the copies the resolved elements shadowed.
         """
-        members = list(members)
-        element_index = self._revision_element_index()
+        remaining = Counter(members)
+        _, element_index, shadowed = self._revision_index()
         count = 0
-        while True:
+        while remaining:
             progressed = False
-            for rev_id in sorted(members, reverse=True):
+            for rev_id in sorted(remaining, reverse=True):
                 if resolve(rev_id, element_index):
                     count += 1
                     progressed = True
+                    remaining[rev_id] -= 1
+                    if not remaining[rev_id]:
+                        del remaining[rev_id]
             if not progressed:
-                return count
+                break
+            if shadowed:
+                _, element_index, shadowed = self._revision_index()
+        return count
 
     def _resolve_group(self, group_id: int, resolve: Callable[[int, dict[str, Element] | None], bool]) -> int:
         """Apply ``resolve`` to every member revision of a group."""
@@ -3502,6 +3554,36 @@ class RevisionManager:
         revision_ids = [rev_id for group_id in self.changeset_groups(changeset_id) for rev_id in self._groups[group_id]]
         return self._resolve_ids(revision_ids, resolve)
 
+    def accept_revisions(self, revision_ids: Iterable[int]) -> int:
+        """Accept several revisions by ID in one resolution.
+
+        Same reverse-id, loop-until-no-progress resolution as accept_group,
+        over an arbitrary id list: the w:id -> element index is built once
+        for the whole list instead of scanning the document per id.
+
+        Args:
+            revision_ids: w:ids of the revisions to accept
+
+        Returns:
+            Number of revisions accepted. Ids not found (or already resolved)
+            are skipped and not counted.
+        """
+        return self._resolve_ids(revision_ids, self.accept_revision)
+
+    def reject_revisions(self, revision_ids: Iterable[int]) -> int:
+        """Reject several revisions by ID in one resolution.
+
+        The counterpart of :meth:`accept_revisions`.
+
+        Args:
+            revision_ids: w:ids of the revisions to reject
+
+        Returns:
+            Number of revisions rejected. Ids not found (or already resolved)
+            are skipped and not counted.
+        """
+        return self._resolve_ids(revision_ids, self.reject_revision)
+
     def accept_group(self, group_id: int) -> int:
         """Accept every revision in a revision group.
 
@@ -3582,17 +3664,7 @@ class RevisionManager:
         Returns:
             Number of revisions accepted
         """
-        count = 0
-        while True:
-            progressed = False
-            # Process in reverse order by ID to avoid index issues
-            revisions = self.list_revisions(author=author, with_location=False)
-            for rev in sorted(revisions, key=lambda r: r.id, reverse=True):
-                if self.accept_revision(rev.id):
-                    count += 1
-                    progressed = True
-            if not progressed:
-                return count
+        return self._resolve_all(author, self.accept_revision)
 
     def reject_all(self, author: str | None = None) -> int:
         """Reject all revisions, optionally filtered by author.
@@ -3610,18 +3682,72 @@ class RevisionManager:
         Returns:
             Number of revisions rejected
         """
+        return self._resolve_all(author, self.reject_revision)
+
+    def _resolve_all(self, author: str | None, resolve: Callable[[int, dict[str, Element] | None], bool]) -> int:
+        """Apply ``resolve`` (accept/reject_revision) to every matching revision.
+
+        Each pass is a single document walk (``_revision_index``) yielding
+        both the worklist and the w:id -> element index, so every ``resolve``
+        call is an O(1) lookup. Elements a pass resolves are detached, which
+        ``_is_in_document`` reports as gone; nested revisions and a duplicate
+        w:id shadowed in this pass's index surface in the next pass, so the
+        loop still runs until nothing progresses.
+
+        The index is only rebuilt when the last pass left work behind: a pass
+        that resolved every listed id with no shadowed duplicate has detached
+        every matching element (accept/reject never create revisions), so the
+        confirming no-progress walk is skipped.
+        """
         count = 0
         while True:
-            progressed = False
-            # Process in reverse order by ID to avoid index issues
-            revisions = self.list_revisions(author=author, with_location=False)
-            for rev in sorted(revisions, key=lambda r: r.id, reverse=True):
-                if self.reject_revision(rev.id):
-                    count += 1
-                    progressed = True
-            if not progressed:
+            rev_ids, element_index, shadowed = self._revision_index(author)
+            resolved = 0
+            for rev_id in rev_ids:
+                if resolve(rev_id, element_index):
+                    resolved += 1
+            count += resolved
+            if not resolved or (resolved == len(rev_ids) and not shadowed):
                 return count
 
+    def _revision_index(self, author: str | None = None) -> tuple[list[int], dict[str, Element], bool]:
+        """Map ``w:id`` -> its <w:ins>/<w:del> element in one document walk.
+
+        The single index builder behind bulk resolution and ref location, so
+        ``accept_revision``/``reject_revision`` locate an element with an O(1)
+        lookup instead of a fresh full-document scan (ISSUES.md #57).
+
+        Returns the ids ``list_revisions(author)`` would report, in reverse id
+        order; the element map, with the fresh scan's precedence (insertions
+        shadow same-id deletions; first in document order wins); and whether
+        any non-empty w:id occurred more than once — in which case some
+        element is unreachable through the map until the one shadowing it is
+        resolved and the index rebuilt. Only id and author are read per
+        element — none of the text, nesting and group fields a full Revision
+        carries.
+        """
+        ins_index: dict[str, Element] = {}
+        del_index: dict[str, Element] = {}
+        seen: set[str] = set()
+        shadowed = False
+        rev_ids: list[int] = []
+        for elem in _revision_elements(self.editor.dom):
+            rev_id = elem.getAttribute("w:id")
+            (ins_index if elem.tagName == "w:ins" else del_index).setdefault(rev_id, elem)
+            if not rev_id:
+                continue
+            if rev_id in seen:
+                shadowed = True
+            seen.add(rev_id)
+            if author is not None and (elem.getAttribute("w:author") or "Unknown") != author:
+                continue
+            try:
+                rev_ids.append(int(rev_id))
+            except ValueError:
+                continue  # unlisted, as in _parse_revision
+        rev_ids.sort(reverse=True)
+        return rev_ids, {**del_index, **ins_index}, shadowed
+
     def _unwrap_element(self, elem) -> None:
         """Remove an element's wrapper, keeping its children in place."""
         parent = elem.parentNode
@@ -3636,17 +3762,12 @@ class RevisionManager:
 
     def _restore_deletion(self, del_elem) -> None:
         """Restore deleted content by converting w:delText back to w:t."""
-        # Convert all w:delText to w:t
-        for del_text in list(del_elem.getElementsByTagName("w:delText")):
-            t_elem = self.editor.dom.createElement("w:t")
-            # Copy content
-            while del_text.firstChild:
-                t_elem.appendChild(del_text.firstChild)
-            # Copy attributes
-            for i in range(del_text.attributes.length):
-                attr = del_text.attributes.item(i)
-                t_elem.setAttribute(attr.name, attr.value)
-            del_text.parentNode.replaceChild(t_elem, del_text)
+        # Convert all w:delText to w:t. Renaming in place keeps the element's
+        # children and attributes (xml:space) where they are — no new element,
+        # no attribute copy, no replaceChild scan of the run's childNodes.
+        dom = self.editor.dom
+        for del_text in del_elem.getElementsByTagName("w:delText"):
+            dom.renameNode(del_text, del_text.namespaceURI, "w:t")
 
         # Update run attributes: w:rsidDel back to w:rsidR
         for run in del_elem.getElementsByTagName("w:r"):
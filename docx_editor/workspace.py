@@ -812,9 +812,10 @@ class Workspace:
             raise WorkspaceError(f"Failed to pack document to {output_path}")
 
         # Update the recorded source fingerprint if saving to the original
-        # location. overwrites_source uses os.path.samefile (see _is_source), so
-        # a different name for the same file — including through a symlink —
-        # still refreshes it, or the next open() would report a stale workspace.
+        # location. overwrites_source compares file identity with os.path.samestat
+        # (see _is_source), so a different name for the same file — including
+        # through a symlink — still refreshes it, or the next open() would report
+        # a stale workspace.
         # mtime/size are refreshed alongside the hash: sync_check() needs size
         # for its cheap reject, and legacy library versions reading this meta
         # compare mtime+size only.
@@ -833,13 +834,16 @@ class Workspace:
     def _is_source(self, output_path: Path) -> bool:
         """True if output_path names the same file as the workspace source.
 
-        samefile() where possible: on case-insensitive filesystems (macOS, Windows)
+        File identity where possible: on case-insensitive filesystems (macOS, Windows)
         and through symlinks/hardlinks, a plain path comparison misses the match and
-        would skip the staleness check entirely.
+        would skip the staleness check entirely. Each path is stat()ed once and the
+        results compared with samestat(), rather than exists() twice and then
+        samefile() stat()ing both paths again.
         """
-        if output_path.exists() and self.source_path.exists():
-            return os.path.samefile(output_path, self.source_path)
-        return output_path.resolve() == self.source_path
+        try:
+            return os.path.samestat(output_path.stat(), self.source_path.stat())
+        except OSError:
+            return output_path.resolve() == self.source_path
 
     def close(self, cleanup: bool = True) -> None:
         """Close the workspace and release its advisory lock.
@@ -885,10 +889,11 @@ class Workspace:
         Returns:
             True if in sync, False if source has changed
         """
-        if not self.source_path.exists():
+        try:
+            source_stat = self.source_path.stat()
+        except OSError:
             return False
 
-        source_stat = self.source_path.stat()
         recorded_sha256 = self.meta.get("source_sha256")
         if recorded_sha256 is not None:
             if self.meta.get("source_size") != source_stat.st_size:
@@ -176,9 +176,18 @@ def count_in_text_map(text_map: TextMap, search: str) -> int:
     (successive matches may overlap), so the result is exactly the number of
     distinct ``occurrence`` values ``find_in_text_map`` can resolve.
     """
+    return count_in_text(text_map.text, search)
+
+
+def count_in_text(text: str, search: str) -> int:
+    """``count_in_text_map`` on a bare string (same overlapping semantics).
+
+    Lets document-wide scans count against :func:`paragraph_visible_text`
+    without building a text map for every paragraph.
+    """
     count = 0
     start = 0
-    while (idx := text_map.find(search, start)) != -1:
+    while (idx := text.find(search, start)) != -1:
         count += 1
         start = idx + 1
     return count
@@ -243,9 +252,9 @@ def compute_text_hash(text: str) -> str:
 def compute_paragraph_hash(paragraph) -> str:
     """Compute a 4-char hex content hash for a paragraph element.
 
-    Uses CRC32 of the paragraph's visible text (from build_text_map).
+    Uses CRC32 of the paragraph's visible text (see paragraph_visible_text).
     """
-    return compute_text_hash(build_text_map(paragraph).text)
+    return compute_text_hash(paragraph_visible_text(paragraph))
 
 
 @dataclass(frozen=True)
@@ -673,7 +682,7 @@ def _compute_heading_paths(paragraphs, style_outlines: dict[str, int]) -> list[t
                 stack.pop()
         paths.append(tuple(text for _, text in stack))
         if level is not None:
-            stack.append((level, build_text_map(p).text))
+            stack.append((level, paragraph_visible_text(p)))
     return paths
 
 
@@ -780,6 +789,23 @@ def _is_inside_element(node, tag_name: str) -> bool:
     return False
 
 
+def iter_elements(root, tag: str) -> Iterator[Element]:
+    """Yield ``tag`` elements below ``root`` in document order, lazily.
+
+    Same result order as ``root.getElementsByTagName(tag)`` (``"*"`` matches
+    any element), but the walk advances only as far as the caller consumes —
+    a lookup that stops at the first hit never visits the rest of the tree.
+    """
+    stack = list(reversed(root.childNodes))
+    while stack:
+        elem = stack.pop()
+        if elem.nodeType != elem.ELEMENT_NODE:
+            continue
+        stack.extend(reversed(elem.childNodes))
+        if tag == "*" or elem.tagName == tag:
+            yield elem
+
+
 def get_text_node_data(elem) -> str:
     """Concatenate all direct TEXT_NODE children of ``elem`` into one string.
 
@@ -791,7 +817,12 @@ def get_text_node_data(elem) -> str:
     Does NOT recurse into element children. For recursive extraction across
     a subtree see ``XMLEditor._get_element_text``.
     """
-    return "".join(c.data for c in elem.childNodes if c.nodeType == c.TEXT_NODE)
+    children = elem.childNodes
+    if len(children) == 1:
+        # The common case: one text child, read directly
+        only = children[0]
+        return only.data if only.nodeType == only.TEXT_NODE else ""
+    return "".join(c.data for c in children if c.nodeType == c.TEXT_NODE)
 
 
 def rebuild_run_fragments(run, rPr_xml: str, render_wt: Callable[[Element], list[str]]) -> list[str]:
@@ -820,7 +851,15 @@ def rebuild_run_fragments(run, rPr_xml: str, render_wt: Callable[[Element], list
 
 
 def _escape_xml(text: str) -> str:
-    """Escape text for safe XML inclusion."""
+    """Escape text for safe XML inclusion.
+
+    Quotes too: the same helper feeds attribute values (w:author, w:val).
+    Chained ``str.replace`` beats both ``str.translate`` (which takes a slow
+    per-character path for multi-character replacements) and
+    ``xml.sax.saxutils.escape`` (the same chain plus a dict loop); a
+    ``replace`` that finds nothing returns its input without copying, so
+    plain run text costs five C-level scans and no allocation.
+    """
     return (
         text
         .replace("&", "&amp;")
@@ -855,6 +894,30 @@ def render_plain_wt(wt, rPr_xml: str) -> list[str]:
     return [f"<w:r>{rPr_xml}<w:t>{_escape_xml(wt_text)}</w:t></w:r>"]
 
 
+def _accepted_text_nodes(paragraph) -> Iterator[Element]:
+    """Yield the w:t nodes that make up ``paragraph``'s accepted view.
+
+    The single source of the accepted-view selection: paragraph hashes come
+    from :func:`paragraph_visible_text` and edits resolve through
+    :func:`build_text_map`, so both must pick exactly the same nodes.
+    """
+    for node in paragraph.getElementsByTagName("w:t"):
+        # Skip w:t inside w:del (deleted text uses w:delText, but be safe)
+        if not _is_inside_element(node, "w:del"):
+            yield node
+
+
+def paragraph_visible_text(paragraph) -> str:
+    """The accepted-view text of ``paragraph`` — ``build_text_map(p).text``.
+
+    Reads the same nodes as the accepted view of :func:`build_text_map`, but
+    without allocating a TextPosition per character, so document-wide
+    searches can cheaply rule out paragraphs that cannot match and build
+    the full map only where a match actually lives.
+    """
+    return "".join(get_text_node_data(node) for node in _accepted_text_nodes(paragraph))
+
+
 def build_text_map(paragraph, view: Literal["accepted", "original"] = "accepted") -> TextMap:
     """Build a text map for a paragraph element.
 
@@ -876,11 +939,7 @@ def build_text_map(paragraph, view: Literal["accepted", "original"] = "accepted"
     positions: list[TextPosition] = []
 
     if view == "accepted":
-        for node in paragraph.getElementsByTagName("w:t"):
-            # Skip w:t inside w:del (deleted text uses w:delText, but be safe)
-            if _is_inside_element(node, "w:del"):
-                continue
-
+        for node in _accepted_text_nodes(paragraph):
             inside_ins = _is_inside_element(node, "w:ins")
             node_text = get_text_node_data(node)
 
@@ -1086,23 +1145,40 @@ class XMLEditor:
         Returns:
             List of matching DOM elements (may be empty)
         """
-        matches = []
-        for elem in self.dom.getElementsByTagName(tag):
+        return list(self.iter_nodes(tag, attrs=attrs, contains=contains))
+
+    def iter_nodes(
+        self,
+        tag: str,
+        attrs: dict[str, str] | None = None,
+        contains: str | None = None,
+    ) -> Iterator:
+        """Yield DOM elements matching the given criteria, in document order.
+
+        Lazy form of find_all_nodes(): the document is walked only as far as
+        the caller consumes, so ``next(editor.iter_nodes("w:t", contains=x))``
+        stops at the first hit instead of materializing every match.
+
+        Args:
+            tag: The XML tag name (e.g., "w:t", "w:p"), or "*" for any element
+            attrs: Dictionary of attribute name-value pairs to match
+            contains: Text string that must appear in any text node within the element
+
+        Yields:
+            Matching DOM elements
+        """
+        normalized_contains = html.unescape(contains) if contains is not None else None
+        for elem in iter_elements(self.dom, tag):
             # Check attrs filter
             if attrs is not None:
                 if not all(elem.getAttribute(attr_name) == attr_value for attr_name, attr_value in attrs.items()):
                     continue
 
             # Check contains filter
-            if contains is not None:
-                elem_text = self._get_element_text(elem)
-                normalized_contains = html.unescape(contains)
-                if normalized_contains not in elem_text:
-                    continue
-
-            matches.append(elem)
+            if normalized_contains is not None and normalized_contains not in self._get_element_text(elem):
+                continue
 
-        return matches
+            yield elem
 
     def _get_element_text(self, elem) -> str:
         """Recursively extract all text content from an element.
@@ -43,6 +43,12 @@ def replace_document_xml(src: Path, dest: Path, new_doc_xml: str) -> None:
     replace_docx_parts(src, dest, {"word/document.xml": new_doc_xml})
 
 
+def touch_externally(path: Path, data: bytes = b"\x00") -> None:
+    """Simulate an external edit by appending ``data`` to ``path`` in place."""
+    with open(path, "ab") as f:
+        f.write(data)
+
+
 NS = 'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
 
 # XML with an entity declaration: defusedxml refuses it (EntitiesForbidden),
@@ -108,11 +114,17 @@ def isolated_workspace_base(monkeypatch):
     shutil.rmtree(base, ignore_errors=True)
 
 
+@pytest.fixture(scope="session")
+def simple_docx_bytes() -> bytes:
+    """Contents of simple.docx, read from disk once per session."""
+    return (Path(__file__).parent / "test_data" / "simple.docx").read_bytes()
+
+
 @pytest.fixture
-def temp_docx(simple_docx, temp_dir) -> Path:
-    """Copy simple.docx to a temp location for testing."""
+def temp_docx(simple_docx_bytes, temp_dir) -> Path:
+    """Write a fresh copy of simple.docx to a temp location for testing."""
     dest = temp_dir / "test_document.docx"
-    shutil.copy(simple_docx, dest)
+    dest.write_bytes(simple_docx_bytes)
     return dest
 
 
@@ -179,6 +179,77 @@ class TestSuggestDeletionAcrossNodes:
         tm = build_text_map(paras[0])
         assert tm.text == "af"
 
+    @pytest.mark.parametrize("method", ["suggest_deletion", "replace_text"])
+    def test_rpr_serialized_once_per_run(self, temp_dir, monkeypatch, method):
+        """Run properties are serialized per run, not per matched character."""
+        import docx_editor.track_changes as track_changes
+
+        editor = _make_editor_with_split_runs(temp_dir, ["a" * 40, "b" * 40], rPr_xml="<w:rPr><w:b/></w:rPr>")
+        mgr = RevisionManager(editor)
+        serialized = []
+        original = track_changes.get_rPr_xml
+
+        def recording(run):
+            serialized.append(run)
+            return original(run)
+
+        monkeypatch.setattr(track_changes, "get_rPr_xml", recording)
+        args = ("a" * 30 + "b" * 30,) if method == "suggest_deletion" else ("a" * 30 + "b" * 30, "X")
+        getattr(mgr, method)(*args)
+
+        assert len(serialized) <= 4
+
+
+class TestWholeRunFastPath:
+    """A match covering exactly one single-text run is marked deleted in place."""
+
+    def test_replace_whole_run_keeps_run_element(self, temp_dir):
+        editor = _make_editor_with_formatted_runs(
+            temp_dir, [("Hello ", ""), ("brave", "<w:rPr><w:i/></w:rPr>"), (" world", "")]
+        )
+        mgr = RevisionManager(editor)
+        run = editor.dom.getElementsByTagName("w:r")[1]
+
+        change_id = mgr.replace_text("brave", "bold")
+
+        del_elem = run.parentNode
+        assert del_elem.tagName == "w:del"
+        assert [dt.firstChild.data for dt in run.getElementsByTagName("w:delText")] == ["brave"]
+        ins_elem = del_elem.nextSibling
+        assert ins_elem.tagName == "w:ins"
+        assert int(ins_elem.getAttribute("w:id")) == change_id
+        assert _ins_text(ins_elem) == "bold"
+        assert ins_elem.getElementsByTagName("w:i")
+        assert build_text_map(editor.dom.getElementsByTagName("w:p")[0]).text == "Hello bold world"
+        revs = mgr.list_revisions()
+        assert {r.type for r in revs} == {"insertion", "deletion"}
+        assert len({r.group_id for r in revs}) == 1
+
+    def test_delete_whole_run_keeps_run_element(self, temp_dir):
+        editor = _make_editor_with_split_runs(temp_dir, ["Hello ", "brave", " world"])
+        mgr = RevisionManager(editor)
+        run = editor.dom.getElementsByTagName("w:r")[1]
+
+        change_id = mgr.suggest_deletion("brave")
+
+        assert run.parentNode.tagName == "w:del"
+        assert int(run.parentNode.getAttribute("w:id")) == change_id
+        assert _del_text(editor) == "brave"
+        assert build_text_map(editor.dom.getElementsByTagName("w:p")[0]).text == "Hello  world"
+
+    def test_run_with_other_content_is_rebuilt(self, temp_dir):
+        """A run that also holds a tab is not a single-text run."""
+        editor = _make_editor_with_split_runs(temp_dir, ["Hello ", "brave"])
+        run = editor.dom.getElementsByTagName("w:r")[1]
+        run.appendChild(editor.dom.createElement("w:tab"))
+        mgr = RevisionManager(editor)
+
+        mgr.suggest_deletion("brave")
+
+        assert run.parentNode is None
+        assert _del_text(editor) == "brave"
+        assert editor.dom.getElementsByTagName("w:tab")
+
 
 class TestCrossBoundaryReplaceRoundtrip:
     """Integration round-trip tests using real docx files."""
@@ -5,7 +5,7 @@ import re
 import zipfile
 
 import pytest
-from conftest import ENTITY_DTD_XML, NS, find_ref, replace_document_xml, replace_docx_parts
+from conftest import ENTITY_DTD_XML, NS, find_ref, replace_document_xml, replace_docx_parts, touch_externally
 from defusedxml.common import EntitiesForbidden
 
 import docx_editor
@@ -414,7 +414,7 @@ class TestDocumentEdgeCases:
         # Mutate source bytes and bump mtime explicitly (sleep-based mtime
         # changes are unreliable on coarse-resolution filesystems).
         original_mtime = clean_workspace.stat().st_mtime
-        clean_workspace.write_bytes(clean_workspace.read_bytes() + b"\x00")
+        touch_externally(clean_workspace)
         os.utime(clean_workspace, (original_mtime + 5, original_mtime + 5))
 
         with pytest.raises(WorkspaceSyncError):
@@ -980,7 +980,7 @@ class TestDocumentSaveStaleness:
 
         doc = Document.open(temp_docx, author="Test")
         # Simulate an external edit: change the source file's content.
-        temp_docx.write_bytes(temp_docx.read_bytes() + b"\x00")
+        touch_externally(temp_docx)
         try:
             with pytest.raises(WorkspaceSyncError):
                 doc.save()
@@ -26,6 +26,7 @@ from collections.abc import Callable
 from pathlib import Path
 
 import pytest
+from conftest import touch_externally
 
 from docx_editor import (
     AmbiguousTextError,
@@ -876,7 +877,7 @@ class TestLifecycleErrorFields:
         doc = Document.open(doc_path)
         try:
             # Simulate an external edit: change the source file's content.
-            doc_path.write_bytes(doc_path.read_bytes() + b"\x00")
+            touch_externally(doc_path)
             with pytest.raises(WorkspaceSyncError) as exc_info:
                 doc.save()
             e = exc_info.value
@@ -1054,7 +1055,7 @@ class TestWorkspaceSyncSaveMessage:
     def test_save_time_message_is_layer_neutral(self, doc_path):
         doc = Document.open(doc_path)
         try:
-            doc_path.write_bytes(doc_path.read_bytes() + b"\x00")
+            touch_externally(doc_path)
             with pytest.raises(WorkspaceSyncError) as exc:
                 doc.save()
             e = exc.value
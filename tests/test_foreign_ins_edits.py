@@ -144,6 +144,24 @@ class TestDeleteInsideForeignIns:
         assert _ins_visible_text(a_ins) == "Hello  today"
         assert _visible_text(manager) == "Hello  today"
 
+    def test_ins_ancestor_looked_up_per_node(self, temp_xml, monkeypatch):
+        """Grouping a long match by insertion walks up once per w:t, not per character."""
+        body = _foreign_ins(f"<w:r><w:t>{'a' * 50}</w:t></w:r><w:r><w:t>{'b' * 50}</w:t></w:r>")
+        xml_path = temp_xml(f"<w:p>{body}</w:p>")
+        manager = _make_manager(xml_path)
+        lookups = []
+        original = manager._find_ancestor
+
+        def recording(node, tag_name):
+            lookups.append(tag_name)
+            return original(node, tag_name)
+
+        monkeypatch.setattr(manager, "_find_ancestor", recording)
+        manager.suggest_deletion("a" * 40 + "b" * 40)
+
+        assert _visible_text(manager) == "a" * 10 + "b" * 10
+        assert lookups.count("w:ins") <= 4
+
     def test_delete_at_start(self, temp_xml):
         xml_path = temp_xml(f"<w:p>{_foreign_ins('<w:r><w:t>Hello world</w:t></w:r>')}</w:p>")
         manager = _make_manager(xml_path)
@@ -55,6 +55,16 @@ class TestMultiWtTextMap:
         nodes = {id(pos.node) for pos in match.positions}
         assert len(nodes) == 2, "Match should span two different w:t nodes"
 
+    def test_node_spans_collapse_positions_per_wt(self):
+        """_node_spans yields one (node, first, last) span per w:t node, in order."""
+        from docx_editor.track_changes import _node_spans
+
+        body = _parse_body("<w:p><w:r><w:t>Hello </w:t><w:t>beautiful</w:t></w:r><w:r><w:t> world</w:t></w:r></w:p>")
+        nodes = body.getElementsByTagName("w:t")
+        match = find_in_text_map(build_text_map(body.getElementsByTagName("w:p")[0]), "lo beautiful w")
+
+        assert _node_spans(match.positions) == [(nodes[0], 3, 5), (nodes[1], 0, 8), (nodes[2], 0, 1)]
+
 
 class TestMultiWtCrossBoundary:
     """Test cross-boundary operations with multi-w:t runs.
@@ -116,6 +116,56 @@ class TestDeleteRegularSegmentMultiWt:
         assert "Hello " in text
         assert "world" in text
 
+    def test_adjacent_runs_rebuilt_in_one_insert(self, temp_xml, monkeypatch):
+        """Sibling runs of one regular segment are parsed and inserted once."""
+        xml_path = temp_xml(
+            "<w:p>"
+            "<w:r><w:t>one </w:t></w:r>"
+            "<w:r><w:rPr><w:b/></w:rPr><w:t>two </w:t></w:r>"
+            "<w:r><w:t>three</w:t></w:r>"
+            '<w:ins w:id="1" w:author="Other" w:date="2024-01-01T00:00:00Z">'
+            "<w:r><w:t> four</w:t></w:r>"
+            "</w:ins>"
+            "</w:p>"
+        )
+        mgr = _make_manager(xml_path)
+        calls = []
+        original = mgr.editor.insert_before
+
+        def recording(elem, xml_content):
+            calls.append(xml_content)
+            return original(elem, xml_content)
+
+        monkeypatch.setattr(mgr.editor, "insert_before", recording)
+        mgr.suggest_deletion("e two three f")
+
+        assert _get_text_content(mgr) == "onour"
+        # One fragment for the three regular runs, one for the foreign insertion
+        assert len(calls) == 2
+        assert calls[0].count("<w:del>") == 3
+        deleted = "".join(n.firstChild.data for n in mgr.editor.dom.getElementsByTagName("w:delText"))
+        assert deleted == "e two three f"
+
+    def test_non_adjacent_runs_keep_their_place(self, temp_xml):
+        """Runs separated by other markup are each rebuilt where they stand."""
+        xml_path = temp_xml(
+            "<w:p>"
+            "<w:r><w:t>alpha </w:t></w:r>"
+            '<w:bookmarkStart w:id="0" w:name="mark"/>'
+            "<w:r><w:t>beta</w:t></w:r>"
+            '<w:ins w:id="1" w:author="Other" w:date="2024-01-01T00:00:00Z">'
+            "<w:r><w:t> gamma</w:t></w:r>"
+            "</w:ins>"
+            "</w:p>"
+        )
+        mgr = _make_manager(xml_path)
+        mgr.suggest_deletion("ha beta g")
+
+        p = mgr.editor.dom.getElementsByTagName("w:p")[0]
+        tags = [n.tagName for n in p.childNodes if n.nodeType == n.ELEMENT_NODE]
+        assert tags[:4] == ["w:r", "w:del", "w:bookmarkStart", "w:del"]
+        assert _get_text_content(mgr) == "alpamma"
+
 
 class TestMidNodeInsertionOrder:
     """Test that replacement text appears AFTER preserved prefix when match
@@ -123,6 +123,20 @@ class TestComputeParagraphHash:
         # Insertions are visible, so hashes differ
         assert compute_paragraph_hash(p_with_ins) != compute_paragraph_hash(p_without_ins)
 
+    def test_hashes_visible_text_without_building_a_text_map(self, monkeypatch):
+        """The hash reads the plain visible text; no per-character map is built."""
+        from docx_editor import xml_editor
+
+        p = parse_paragraph(
+            "<w:p><w:r><w:t>Hello </w:t></w:r>"
+            "<w:ins><w:r><w:t>big </w:t></w:r></w:ins>"
+            "<w:del><w:r><w:delText>old </w:delText></w:r></w:del>"
+            "<w:r><w:t>world</w:t></w:r></w:p>"
+        )
+        expected = xml_editor.compute_text_hash(xml_editor.build_text_map(p).text)
+        monkeypatch.setattr(xml_editor, "build_text_map", lambda *a, **k: pytest.fail("text map built"))
+        assert compute_paragraph_hash(p) == expected
+
 
 # ==================== list_paragraphs Tests ====================
 
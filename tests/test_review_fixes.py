@@ -8,7 +8,8 @@ from docx_editor.exceptions import TextNotFoundError
 from docx_editor.track_changes import EditOperation, RevisionManager
 from docx_editor.xml_editor import DocxXMLEditor, build_text_map, compute_paragraph_hash
 
-NS = 'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+NS = f'xmlns:w="{W_NS}"'
 
 
 @pytest.fixture
@@ -28,21 +29,24 @@ def _make_manager(xml_path) -> RevisionManager:
 
 
 def _get_text_content(manager) -> str:
-    dom = manager.editor.dom
+    """Visible text of the whole document: every w:t outside a w:del.
+
+    One descent that carries the inside-w:del flag down, instead of climbing
+    each w:t's ancestor chain to look for a w:del.
+    """
     result = []
-    for wt in dom.getElementsByTagName("w:t"):
-        parent = wt.parentNode
-        inside_del = False
-        while parent:
-            if (
-                parent.localName == "del"
-                and parent.namespaceURI == "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
-            ):
-                inside_del = True
-                break
-            parent = parent.parentNode
-        if not inside_del and wt.firstChild:
-            result.append(wt.firstChild.data)
+
+    def walk(node, inside_del: bool) -> None:
+        for child in node.childNodes:
+            if child.nodeType != child.ELEMENT_NODE:
+                continue
+            if child.tagName == "w:t":
+                if not inside_del and child.firstChild:
+                    result.append(child.firstChild.data)
+            else:
+                walk(child, inside_del or (child.localName == "del" and child.namespaceURI == W_NS))
+
+    walk(manager.editor.dom, False)
     return "".join(result)
 
 
@@ -22,7 +22,7 @@ from pathlib import Path
 import pytest
 from conftest import count_dom_walks, find_ref
 
-from docx_editor import Document, EditOperation, EditResult, RevisionError
+from docx_editor import Document, EditOperation, EditResult, RevisionError, track_changes
 from docx_editor.exceptions import BatchOperationError, DocxEditError
 from docx_editor.track_changes import RevisionManager
 from docx_editor.xml_editor import DocxXMLEditor
@@ -1527,8 +1527,9 @@ class TestAcceptPathIndex:
     """The group/changeset accept path builds one w:id->element index per call
     instead of scanning the whole document per member (ISSUES.md #57).
 
-    Each resolution does exactly two Document-level walks (one w:ins scan, one
-    w:del scan) to build the index, no matter how many revisions it spans.
+    Each resolution makes exactly one revision-element walk to build the index,
+    and no Document-level getElementsByTagName scan, no matter how many
+    revisions it spans.
     Pre-#57, accept_revision/reject_revision each did up to two full-document
     walks, repeated per member per pass (O(members x doc)) — a 240-revision
     accept_changeset paid ~960 walks.
@@ -1557,6 +1558,19 @@ class TestAcceptPathIndex:
         "<w:r><w:t>gamma</w:t></w:r></w:ins></w:p>"
     )
 
+    @staticmethod
+    def _count_index_walks(monkeypatch) -> list:
+        """Record every revision-element walk (one per index build)."""
+        walks: list = []
+        original = track_changes._revision_elements
+
+        def recording(root):
+            walks.append(root)
+            return original(root)
+
+        monkeypatch.setattr(track_changes, "_revision_elements", recording)
+        return walks
+
     @staticmethod
     def _accepted_text(manager: RevisionManager) -> str:
         """Accepted-view text of the manager's DOM (w:delText excluded)."""
@@ -1580,10 +1594,12 @@ class TestAcceptPathIndex:
             assert changeset_id is not None
             assert len(doc.list_revisions()) == 6
 
+            index_walks = self._count_index_walks(monkeypatch)
             walks = count_dom_walks(monkeypatch)
             assert getattr(doc, method)(changeset_id) == 6
             # One index build, not one scan per member per pass.
-            assert walks == ["w:ins", "w:del"]
+            assert len(index_walks) == 1
+            assert walks == []
             assert doc.list_revisions() == []
 
     @pytest.mark.parametrize("method", ["accept_group", "reject_group"])
@@ -1592,9 +1608,11 @@ class TestAcceptPathIndex:
             ref = find_ref(doc, "quick brown fox")
             result = doc.replace("quick", "speedy", paragraph=ref)  # one group, two revs
 
+            index_walks = self._count_index_walks(monkeypatch)
             walks = count_dom_walks(monkeypatch)
             assert getattr(doc, method)(result.group_id) == 2
-            assert walks == ["w:ins", "w:del"]
+            assert len(index_walks) == 1
+            assert walks == []
             assert doc.list_revisions() == []
 
     def test_reject_group_with_nested_member_counts_once(self, temp_xml):
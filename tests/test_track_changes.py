@@ -1,167 +1,109 @@
 """Tests for track changes functionality."""
 
+import dataclasses
+import shutil
 from datetime import datetime, timezone
 from unittest.mock import MagicMock
 
+import defusedxml.minidom
 import pytest
-from conftest import find_ref
+from conftest import count_dom_walks, find_ref
 
-from docx_editor import Document, TextNotFoundError
+from docx_editor import Document, TextNotFoundError, track_changes, xml_editor
+from docx_editor.ooxml.pack import pack_document
+from docx_editor.ooxml.unpack import unpack_document
 from docx_editor.track_changes import Revision, RevisionManager, _escape_xml, _trim_replace_affixes
-from docx_editor.xml_editor import DocxXMLEditor, build_text_map
-
-
-class TestTrackedReplace:
-    """Tests for tracked text replacement."""
-
-    def test_replace_creates_tracked_change(self, clean_workspace):
-        """Test that replace creates w:del and w:ins elements."""
-        doc = Document.open(clean_workspace)
-
-        # Find some text to replace - need to know what's in simple.docx
-        # For now, we'll test that the method doesn't crash
-        try:
-            ref = find_ref(doc, "test")
-            doc.replace("test", "TEST", paragraph=ref)
-        except TextNotFoundError:
-            # Expected if "test" not in document
-            pass
-
-        doc.close()
-
-    def test_replace_returns_new_ref(self, clean_workspace):
-        """Test that replace returns a new paragraph reference."""
-        doc = Document.open(clean_workspace)
-
-        try:
-            ref = find_ref(doc, "the")
-            new_ref = doc.replace("the", "THE", paragraph=ref)
-            assert isinstance(new_ref, str)
-            assert new_ref.startswith("P")
-            assert "#" in new_ref
-        except TextNotFoundError:
-            pytest.skip("Test text not found in document")
-
-        doc.close()
-
-    def test_replace_not_found_raises_error(self, clean_workspace):
-        """Test that replacing nonexistent text raises TextNotFoundError."""
-        doc = Document.open(clean_workspace)
-
-        ref = doc.list_paragraphs()[0].split("|")[0]
-        with pytest.raises(TextNotFoundError):
-            doc.replace("xyz123nonexistent789", "replacement", paragraph=ref)
-
-        doc.close()
-
-
-class TestTrackedDeletion:
-    """Tests for tracked deletions."""
-
-    def test_delete_creates_tracked_change(self, clean_workspace):
-        """Test that delete creates w:del element."""
-        doc = Document.open(clean_workspace)
-
-        try:
-            ref = find_ref(doc, "the")
-            new_ref = doc.delete("the", paragraph=ref)
-            assert isinstance(new_ref, str)
-            assert new_ref.startswith("P")
-        except TextNotFoundError:
-            pytest.skip("Test text not found in document")
-
-        doc.close()
-
-    def test_delete_not_found_raises_error(self, clean_workspace):
-        """Test that deleting nonexistent text raises TextNotFoundError."""
-        doc = Document.open(clean_workspace)
+from docx_editor.xml_editor import DocxXMLEditor, build_text_map, compute_paragraph_hash
+
+# Text that never occurs in simple.docx
+NOT_FOUND = "xyz123nonexistent789"
+
+
+@pytest.fixture
+def opened_doc(clean_workspace):
+    """The simple.docx fixture opened as a Document; closed on teardown."""
+    doc = Document.open(clean_workspace)
+    yield doc
+    doc.close()
+
+
+@pytest.fixture(scope="module")
+def readonly_doc(tmp_path_factory, simple_docx_bytes):
+    """One simple.docx Document shared by this module's query-only tests."""
+    base = tmp_path_factory.mktemp("readonly")
+    path = base / "simple.docx"
+    path.write_bytes(simple_docx_bytes)
+    doc = Document.open(path, workspace_dir=base / "workspaces")
+    text = doc.get_visible_text()
+    yield doc
+    # A test that mutated the shared document would corrupt its neighbours.
+    assert doc.get_visible_text() == text
+    assert doc.list_revisions() == []
+    doc.close()
+
+
+@pytest.fixture
+def edited_doc(opened_doc):
+    """opened_doc carrying one tracked deletion and one tracked insertion."""
+    opened_doc.delete("the", paragraph=find_ref(opened_doc, "the"))
+    opened_doc.insert_after("a", " NEW", paragraph=find_ref(opened_doc, "a"))
+    return opened_doc
+
+
+class TestTrackedEdits:
+    """Tests for tracked replace, delete and insert."""
+
+    @pytest.mark.parametrize(
+        "method, args",
+        [
+            ("replace", ("the", "THE")),
+            ("delete", ("the",)),
+            ("insert_after", ("the", " NEW TEXT")),
+            ("insert_before", ("the", "BEFORE ")),
+        ],
+    )
+    def test_tracked_edit_returns_new_ref(self, opened_doc, method, args):
+        """Each tracked edit returns the edited paragraph's new reference."""
+        ref = find_ref(opened_doc, "the")
+        new_ref = getattr(opened_doc, method)(*args, paragraph=ref)
+        assert isinstance(new_ref, str)
+        assert new_ref.startswith("P")
+        assert "#" in new_ref
 
-        ref = doc.list_paragraphs()[0].split("|")[0]
+    @pytest.mark.parametrize("method, extra", [("replace", ("replacement",)), ("delete", ())])
+    def test_not_found_raises_error(self, readonly_doc, method, extra):
+        """Editing text that is not in the paragraph raises TextNotFoundError."""
+        ref = readonly_doc.list_paragraphs()[0].split("|")[0]
         with pytest.raises(TextNotFoundError):
-            doc.delete("xyz123nonexistent789", paragraph=ref)
-
-        doc.close()
-
-
-class TestTrackedInsertion:
-    """Tests for tracked insertions."""
-
-    def test_insert_after_creates_tracked_change(self, clean_workspace):
-        """Test that insert_after creates w:ins element."""
-        doc = Document.open(clean_workspace)
-
-        try:
-            ref = find_ref(doc, "the")
-            new_ref = doc.insert_after("the", " NEW TEXT", paragraph=ref)
-            assert isinstance(new_ref, str)
-            assert new_ref.startswith("P")
-        except TextNotFoundError:
-            pytest.skip("Anchor text not found in document")
-
-        doc.close()
-
-    def test_insert_before_creates_tracked_change(self, clean_workspace):
-        """Test that insert_before creates w:ins element."""
-        doc = Document.open(clean_workspace)
-
-        try:
-            ref = find_ref(doc, "the")
-            new_ref = doc.insert_before("the", "BEFORE ", paragraph=ref)
-            assert isinstance(new_ref, str)
-            assert new_ref.startswith("P")
-        except TextNotFoundError:
-            pytest.skip("Anchor text not found in document")
-
-        doc.close()
+            getattr(readonly_doc, method)(NOT_FOUND, *extra, paragraph=ref)
 
 
 class TestRevisionListing:
     """Tests for listing revisions."""
 
-    def test_list_revisions_empty_document(self, clean_workspace):
+    def test_list_revisions_empty_document(self, readonly_doc):
         """Test listing revisions on document without changes."""
-        doc = Document.open(clean_workspace)
-
-        revisions = doc.list_revisions()
+        revisions = readonly_doc.list_revisions()
         # May be empty or have pre-existing revisions
         assert isinstance(revisions, list)
 
-        doc.close()
-
-    def test_list_revisions_after_changes(self, clean_workspace):
+    def test_list_revisions_after_changes(self, edited_doc):
         """Test listing revisions after making changes."""
-        doc = Document.open(clean_workspace)
-
-        try:
-            ref = find_ref(doc, "the")
-            doc.delete("the", paragraph=ref)
-            ref2 = find_ref(doc, "a")
-            doc.insert_after("a", " NEW", paragraph=ref2)
-        except TextNotFoundError:
-            pytest.skip("Test text not found in document")
-
-        revisions = doc.list_revisions()
+        revisions = edited_doc.list_revisions()
         assert len(revisions) >= 2
 
-        # Check revision attributes
+        # Every revision is a Revision, so its fields are checked once on the class
+        assert {"id", "type", "author", "text"} <= {f.name for f in dataclasses.fields(Revision)}
         for rev in revisions:
-            assert hasattr(rev, "id")
-            assert hasattr(rev, "type")
-            assert hasattr(rev, "author")
-            assert hasattr(rev, "text")
+            assert isinstance(rev, Revision)
             assert rev.type in ("insertion", "deletion")
 
-        doc.close()
-
     def test_list_revisions_filter_by_author(self, clean_workspace):
         """Test filtering revisions by author."""
         doc = Document.open(clean_workspace, author="TestAuthor")
 
-        try:
-            ref = find_ref(doc, "the")
-            doc.delete("the", paragraph=ref)
-        except TextNotFoundError:
-            pytest.skip("Test text not found in document")
+        ref = find_ref(doc, "the")
+        doc.delete("the", paragraph=ref)
 
         author_revisions = doc.list_revisions(author="TestAuthor")
 
@@ -175,177 +117,203 @@ class TestRevisionListing:
 class TestRevisionAcceptReject:
     """Tests for accepting and rejecting revisions."""
 
-    def test_accept_revision(self, clean_workspace):
+    def test_accept_revision(self, edited_doc):
         """Test accepting a revision."""
-        doc = Document.open(clean_workspace)
-
-        try:
-            ref = find_ref(doc, "the")
-            doc.delete("the", paragraph=ref)
-        except TextNotFoundError:
-            pytest.skip("Test text not found in document")
-
-        revisions = doc.list_revisions()
+        revisions = edited_doc.list_revisions()
         change_id = revisions[-1].id
 
-        result = doc.accept_revision(change_id)
+        result = edited_doc.accept_revision(change_id)
         assert result is True
 
         # Revision should no longer be in list
-        revisions = doc.list_revisions()
-        revision_ids = [r.id for r in revisions]
+        revisions = edited_doc.list_revisions()
+        revision_ids = {r.id for r in revisions}
         assert change_id not in revision_ids
 
-        doc.close()
-
-    def test_reject_revision(self, clean_workspace):
+    def test_reject_revision(self, edited_doc):
         """Test rejecting a revision."""
-        doc = Document.open(clean_workspace)
-
-        try:
-            ref = find_ref(doc, "the")
-            doc.delete("the", paragraph=ref)
-        except TextNotFoundError:
-            pytest.skip("Test text not found in document")
-
-        revisions = doc.list_revisions()
+        revisions = edited_doc.list_revisions()
         change_id = revisions[-1].id
 
-        result = doc.reject_revision(change_id)
+        result = edited_doc.reject_revision(change_id)
         assert result is True
 
-        doc.close()
-
-    def test_accept_nonexistent_revision(self, clean_workspace):
+    def test_accept_nonexistent_revision(self, readonly_doc):
         """Test accepting a revision that doesn't exist."""
-        doc = Document.open(clean_workspace)
-
-        result = doc.accept_revision(99999)
+        result = readonly_doc.accept_revision(99999)
         assert result is False
 
-        doc.close()
-
-    def test_accept_all(self, clean_workspace):
+    def test_accept_all(self, edited_doc):
         """Test accepting all revisions."""
-        doc = Document.open(clean_workspace)
+        accepted = edited_doc.accept_all()
 
-        try:
-            ref = find_ref(doc, "the")
-            doc.delete("the", paragraph=ref)
-            ref2 = find_ref(doc, "a")
-            doc.insert_after("a", " NEW", paragraph=ref2)
-        except TextNotFoundError:
-            pytest.skip("Test text not found in document")
+        # The fixture's one deletion and one insertion are all there is
+        assert accepted == 2
+        assert edited_doc.list_revisions() == []
 
-        initial_count = len(doc.list_revisions())
-        accepted = doc.accept_all()
+    def test_reject_all(self, edited_doc):
+        """Test rejecting all revisions."""
+        rejected = edited_doc.reject_all()
 
-        assert accepted >= 0
-        assert len(doc.list_revisions()) == initial_count - accepted
+        # The fixture's one deletion and one insertion are all there is
+        assert rejected == 2
+        assert edited_doc.list_revisions() == []
 
-        doc.close()
 
-    def test_reject_all(self, clean_workspace):
-        """Test rejecting all revisions."""
-        doc = Document.open(clean_workspace)
+class TestCountMatches:
+    """Tests for count_matches functionality."""
 
-        try:
-            ref = find_ref(doc, "the")
-            doc.delete("the", paragraph=ref)
-            ref2 = find_ref(doc, "a")
-            doc.insert_after("a", " NEW", paragraph=ref2)
-        except TextNotFoundError:
-            pytest.skip("Test text not found in document")
+    def test_count_matches_returns_int(self, readonly_doc):
+        """Test that count_matches returns an integer."""
+        count = readonly_doc.count_matches("the")
+        assert isinstance(count, int)
+        assert count >= 0
 
-        initial_count = len(doc.list_revisions())
-        rejected = doc.reject_all()
+    def test_count_matches_nonexistent_returns_zero(self, readonly_doc):
+        """Test that count_matches returns 0 for nonexistent text."""
+        count = readonly_doc.count_matches(NOT_FOUND)
+        assert count == 0
 
-        assert rejected >= 0
-        assert len(doc.list_revisions()) == initial_count - rejected
+    def test_document_wide_lookup_maps_only_matching_paragraph(self, monkeypatch):
+        """Paragraphs that cannot hold the occurrence are counted on plain text.
 
-        doc.close()
+        Only the paragraph holding the requested occurrence pays for a text
+        map; occurrences in earlier paragraphs still count toward the index.
+        """
+        manager = _make_revision_manager(
+            "<w:body>"
+            "<w:p><w:r><w:t>alpha</w:t></w:r></w:p>"
+            "<w:p><w:r><w:t>a target</w:t></w:r><w:r><w:t> and tar</w:t></w:r><w:r><w:t>get</w:t></w:r></w:p>"
+            "<w:p><w:r><w:t>one more target</w:t></w:r></w:p>"
+            "</w:body>"
+        )
+        mapped = []
+        original = track_changes.build_text_map
 
+        def recording(p, *args, **kwargs):
+            mapped.append(p)
+            return original(p, *args, **kwargs)
 
-class TestCountMatches:
-    """Tests for count_matches functionality."""
+        monkeypatch.setattr(track_changes, "build_text_map", recording)
 
-    def test_count_matches_returns_int(self, clean_workspace):
-        """Test that count_matches returns an integer."""
-        doc = Document.open(clean_workspace)
+        assert manager.count_matches("target") == 3
+        assert mapped == []
 
-        count = doc.count_matches("the")
-        assert isinstance(count, int)
-        assert count >= 0
+        located = manager._find_across_boundaries_located("target", occurrence=2)
+        assert located is not None
+        assert located.paragraph_index == 3
+        assert located.paragraph_occurrence == 0
+        assert mapped == [located.paragraph]
 
-        doc.close()
+        assert manager._find_across_boundaries_located("target", occurrence=1).paragraph_occurrence == 1
+        assert manager._find_across_boundaries_located("target", occurrence=3) is None
 
-    def test_count_matches_nonexistent_returns_zero(self, clean_workspace):
-        """Test that count_matches returns 0 for nonexistent text."""
-        doc = Document.open(clean_workspace)
+    def test_document_wide_lookup_reports_diverged_text_passes(self, monkeypatch):
+        """A count/text-map disagreement is an explicit error, not a None match."""
+        manager = _make_revision_manager("<w:body><w:p><w:r><w:t>plain</w:t></w:r></w:p></w:body>")
+        monkeypatch.setattr(track_changes, "paragraph_visible_text", lambda p: "target")
 
-        count = doc.count_matches("xyz123nonexistent789")
-        assert count == 0
+        with pytest.raises(RuntimeError, match="text map has no occurrence 0"):
+            manager._find_across_boundaries_located("target")
 
-        doc.close()
+    def test_count_matches_many_agrees_with_count_matches(self, readonly_doc):
+        """Batch counts equal per-text count_matches, keyed in input order."""
+        texts = ["the", NOT_FOUND, "a", "the"]
+        counts = readonly_doc.count_matches_many(texts)
+        assert list(counts) == ["the", NOT_FOUND, "a"]
+        assert counts == {text: readonly_doc.count_matches(text) for text in texts}
+
+    def test_count_matches_many_walks_paragraphs_once(self, monkeypatch):
+        """Every needle shares one visible-text computation per paragraph."""
+        manager = _make_revision_manager(
+            "<w:body>"
+            "<w:p><w:r><w:t>a target</w:t></w:r><w:r><w:t> and tar</w:t></w:r><w:r><w:t>get</w:t></w:r></w:p>"
+            '<w:p><w:ins w:id="1" w:author="A"><w:r><w:t>aaa</w:t></w:r></w:ins></w:p>'
+            "</w:body>"
+        )
+        computed = []
+        original = track_changes.paragraph_visible_text
+
+        def recording(p):
+            computed.append(p)
+            return original(p)
+
+        monkeypatch.setattr(track_changes, "paragraph_visible_text", recording)
+
+        assert manager.count_matches_many(["target", "aa", "missing"]) == {"target": 2, "aa": 2, "missing": 0}
+        assert len(computed) == 2
+
+    def test_find_all_walks_matching_paragraph_twice(self, monkeypatch):
+        """find_all reuses the pre-filter's visible text for the paragraph hash.
+
+        A matching paragraph needs the cheap visible-text pass and its text
+        map; computing the hash must not add a third walk of its w:t nodes.
+        """
+        manager = _make_revision_manager(
+            "<w:body>"
+            "<w:p><w:r><w:t>no hit here</w:t></w:r></w:p>"
+            "<w:p><w:r><w:t>a target and a target</w:t></w:r></w:p>"
+            "</w:body>"
+        )
+        walked = []
+        original = xml_editor._accepted_text_nodes
+
+        def recording(p):
+            walked.append(p)
+            return original(p)
+
+        monkeypatch.setattr(xml_editor, "_accepted_text_nodes", recording)
+
+        results = manager.find_all("target")
+        assert [r.paragraph_occurrence for r in results] == [0, 1]
+        assert len(walked) == 3  # one for the miss, two for the hit
+        hit = manager.editor.dom.getElementsByTagName("w:p")[1]
+        assert results[0].paragraph_ref == f"P2#{compute_paragraph_hash(hit)}"
+
+    def test_count_matches_many_rejects_bare_string(self):
+        """A single string is not silently counted character by character."""
+        manager = _make_revision_manager("<w:body><w:p><w:r><w:t>abc</w:t></w:r></w:p></w:body>")
+        with pytest.raises(ValueError, match="collection of strings"):
+            manager.count_matches_many("abc")
 
 
 class TestOccurrenceParameter:
     """Tests for occurrence parameter in editing methods."""
 
-    def test_replace_with_occurrence(self, clean_workspace):
+    def test_replace_with_occurrence(self, opened_doc):
         """Test replace with specific occurrence within a paragraph."""
-        doc = Document.open(clean_workspace)
-
         # P2: "The quick brown fox jumps over the lazy dog."
         # 'over' appears once. Use occurrence=0 on the right paragraph
         # to verify occurrence param is accepted.
-        ref = find_ref(doc, "lazy dog")
-        new_ref = doc.replace("the", "THE", paragraph=ref, occurrence=0)
+        ref = find_ref(opened_doc, "lazy dog")
+        new_ref = opened_doc.replace("the", "THE", paragraph=ref, occurrence=0)
         assert isinstance(new_ref, str)
 
-        doc.close()
-
-    def test_replace_occurrence_out_of_range(self, clean_workspace):
+    def test_replace_occurrence_out_of_range(self, opened_doc):
         """Test replace with occurrence beyond available matches."""
-        doc = Document.open(clean_workspace)
-
         # 'the' appears once in P2, request occurrence=5
-        ref = find_ref(doc, "lazy dog")
+        ref = find_ref(opened_doc, "lazy dog")
         with pytest.raises(TextNotFoundError):
-            doc.replace("the", "REPLACEMENT", paragraph=ref, occurrence=5)
-
-        doc.close()
+            opened_doc.replace("the", "REPLACEMENT", paragraph=ref, occurrence=5)
 
-    def test_delete_with_occurrence(self, clean_workspace):
+    def test_delete_with_occurrence(self, opened_doc):
         """Test delete with specific occurrence."""
-        doc = Document.open(clean_workspace)
-
-        ref = find_ref(doc, "lazy dog")
-        new_ref = doc.delete("the", paragraph=ref, occurrence=0)
+        ref = find_ref(opened_doc, "lazy dog")
+        new_ref = opened_doc.delete("the", paragraph=ref, occurrence=0)
         assert isinstance(new_ref, str)
 
-        doc.close()
-
-    def test_insert_after_with_occurrence(self, clean_workspace):
+    def test_insert_after_with_occurrence(self, opened_doc):
         """Test insert_after with specific occurrence."""
-        doc = Document.open(clean_workspace)
-
-        ref = find_ref(doc, "lazy dog")
-        new_ref = doc.insert_after("the", " INSERTED", paragraph=ref, occurrence=0)
+        ref = find_ref(opened_doc, "lazy dog")
+        new_ref = opened_doc.insert_after("the", " INSERTED", paragraph=ref, occurrence=0)
         assert isinstance(new_ref, str)
 
-        doc.close()
-
-    def test_insert_before_with_occurrence(self, clean_workspace):
+    def test_insert_before_with_occurrence(self, opened_doc):
         """Test insert_before with specific occurrence."""
-        doc = Document.open(clean_workspace)
-
-        ref = find_ref(doc, "lazy dog")
-        new_ref = doc.insert_before("the", "INSERTED ", paragraph=ref, occurrence=0)
+        ref = find_ref(opened_doc, "lazy dog")
+        new_ref = opened_doc.insert_before("the", "INSERTED ", paragraph=ref, occurrence=0)
         assert isinstance(new_ref, str)
 
-        doc.close()
-
 
 class TestRevisionRepr:
     """Tests for Revision.__repr__ method."""
@@ -397,63 +365,43 @@ class TestRevisionRepr:
 class TestRevisionManagerDirectAccess:
     """Tests for RevisionManager using direct editor access."""
 
-    def test_replace_text_with_before_and_after_text(self, clean_workspace):
+    def test_replace_text_with_before_and_after_text(self, opened_doc):
         """Test replace where match is in the middle of a text node."""
-        doc = Document.open(clean_workspace)
-
         # "quick" is in the middle of "The quick brown fox..."
-        ref = find_ref(doc, "quick")
-        new_ref = doc.replace("quick", "QUICK", paragraph=ref)
+        ref = find_ref(opened_doc, "quick")
+        new_ref = opened_doc.replace("quick", "QUICK", paragraph=ref)
         assert isinstance(new_ref, str)
 
-        doc.close()
-
-    def test_replace_text_preserves_run_properties(self, clean_workspace):
+    def test_replace_text_preserves_run_properties(self, opened_doc):
         """Test that replace preserves w:rPr when present."""
-        doc = Document.open(clean_workspace)
-
         # Replace text - the document structure should be preserved
-        ref = find_ref(doc, "Sample")
-        new_ref = doc.replace("Sample", "SAMPLE", paragraph=ref)
+        ref = find_ref(opened_doc, "Sample")
+        new_ref = opened_doc.replace("Sample", "SAMPLE", paragraph=ref)
         assert isinstance(new_ref, str)
 
-        doc.close()
-
-    def test_suggest_deletion_with_surrounding_text(self, clean_workspace):
+    def test_suggest_deletion_with_surrounding_text(self, opened_doc):
         """Test deletion when text has surrounding content."""
-        doc = Document.open(clean_workspace)
-
         # "brown" is in the middle of "The quick brown fox..."
-        ref = find_ref(doc, "brown")
-        new_ref = doc.delete("brown", paragraph=ref)
+        ref = find_ref(opened_doc, "brown")
+        new_ref = opened_doc.delete("brown", paragraph=ref)
         assert isinstance(new_ref, str)
 
-        doc.close()
-
-    def test_insert_text_not_found_raises_error(self, clean_workspace):
+    def test_insert_text_not_found_raises_error(self, opened_doc):
         """Test insert_after raises TextNotFoundError for nonexistent anchor."""
-        doc = Document.open(clean_workspace)
-
-        ref = doc.list_paragraphs()[0].split("|")[0]
+        ref = opened_doc.list_paragraphs()[0].split("|")[0]
         with pytest.raises(TextNotFoundError) as exc_info:
-            doc.insert_after("xyz_nonexistent_anchor_123", "new text", paragraph=ref)
+            opened_doc.insert_after("xyz_nonexistent_anchor_123", "new text", paragraph=ref)
 
         assert "Anchor text not found" in str(exc_info.value) or "not found" in str(exc_info.value).lower()
 
-        doc.close()
-
-    def test_insert_before_not_found_raises_error(self, clean_workspace):
+    def test_insert_before_not_found_raises_error(self, opened_doc):
         """Test insert_before raises TextNotFoundError for nonexistent anchor."""
-        doc = Document.open(clean_workspace)
-
-        ref = doc.list_paragraphs()[0].split("|")[0]
+        ref = opened_doc.list_paragraphs()[0].split("|")[0]
         with pytest.raises(TextNotFoundError) as exc_info:
-            doc.insert_before("xyz_nonexistent_anchor_123", "new text", paragraph=ref)
+            opened_doc.insert_before("xyz_nonexistent_anchor_123", "new text", paragraph=ref)
 
         assert "not found" in str(exc_info.value).lower()
 
-        doc.close()
-
 
 class TestRevisionParsing:
     """Tests for revision parsing edge cases."""
@@ -476,123 +424,95 @@ class TestRevisionParsing:
 
         doc.close()
 
-    def test_list_revisions_with_missing_date(self, clean_workspace):
+    def test_list_revisions_with_missing_date(self, opened_doc):
         """Test parsing revisions that may have missing date attributes."""
-        doc = Document.open(clean_workspace)
-
-        ref = find_ref(doc, "quick")
-        doc.delete("quick", paragraph=ref)
-        revisions = doc.list_revisions()
+        ref = find_ref(opened_doc, "quick")
+        opened_doc.delete("quick", paragraph=ref)
+        revisions = opened_doc.list_revisions()
 
         # Should handle revisions regardless of date presence
         for rev in revisions:
             # date can be None or a datetime
             assert rev.date is None or isinstance(rev.date, datetime)
 
-        doc.close()
-
-    def test_list_revisions_with_empty_text(self, clean_workspace):
+    def test_list_revisions_with_empty_text(self, opened_doc):
         """Test parsing revisions where text elements might be empty."""
-        doc = Document.open(clean_workspace)
-
         # Make a change and verify we can list it
-        ref = find_ref(doc, "fox")
-        doc.insert_after("fox", "", paragraph=ref)  # Empty insertion
-        revisions = doc.list_revisions()
+        ref = find_ref(opened_doc, "fox")
+        opened_doc.insert_after("fox", "", paragraph=ref)  # Empty insertion
+        revisions = opened_doc.list_revisions()
 
         # Should not crash on empty text
         assert isinstance(revisions, list)
 
-        doc.close()
-
 
 class TestAcceptRejectExtended:
     """Extended tests for accept/reject functionality."""
 
-    def test_accept_insertion_revision(self, clean_workspace):
+    def test_accept_insertion_revision(self, opened_doc):
         """Test accepting an insertion keeps the inserted text."""
-        doc = Document.open(clean_workspace)
+        ref = find_ref(opened_doc, "fox")
+        opened_doc.insert_after("fox", " NEW", paragraph=ref)
 
-        ref = find_ref(doc, "fox")
-        doc.insert_after("fox", " NEW", paragraph=ref)
-
-        revisions = doc.list_revisions()
+        revisions = opened_doc.list_revisions()
         change_id = revisions[-1].id
 
-        result = doc.accept_revision(change_id)
+        result = opened_doc.accept_revision(change_id)
         assert result is True
 
         # Verify revision is gone
-        revisions = doc.list_revisions()
+        revisions = opened_doc.list_revisions()
         ids = [r.id for r in revisions]
         assert change_id not in ids
 
-        doc.close()
-
-    def test_accept_deletion_revision(self, clean_workspace):
+    def test_accept_deletion_revision(self, opened_doc):
         """Test accepting a deletion removes the deleted text."""
-        doc = Document.open(clean_workspace)
-
-        ref = find_ref(doc, "quick")
-        doc.delete("quick", paragraph=ref)
+        ref = find_ref(opened_doc, "quick")
+        opened_doc.delete("quick", paragraph=ref)
 
-        revisions = doc.list_revisions()
+        revisions = opened_doc.list_revisions()
         change_id = revisions[-1].id
 
-        result = doc.accept_revision(change_id)
+        result = opened_doc.accept_revision(change_id)
         assert result is True
 
         # Verify revision is gone
-        revisions = doc.list_revisions()
+        revisions = opened_doc.list_revisions()
         ids = [r.id for r in revisions]
         assert change_id not in ids
 
-        doc.close()
-
-    def test_reject_insertion_revision(self, clean_workspace):
+    def test_reject_insertion_revision(self, opened_doc):
         """Test rejecting an insertion removes the inserted text."""
-        doc = Document.open(clean_workspace)
+        ref = find_ref(opened_doc, "fox")
+        opened_doc.insert_after("fox", " REJECT_ME", paragraph=ref)
 
-        ref = find_ref(doc, "fox")
-        doc.insert_after("fox", " REJECT_ME", paragraph=ref)
-
-        revisions = doc.list_revisions()
+        revisions = opened_doc.list_revisions()
         change_id = revisions[-1].id
 
-        result = doc.reject_revision(change_id)
+        result = opened_doc.reject_revision(change_id)
         assert result is True
 
         # Verify revision is gone
-        revisions = doc.list_revisions()
+        revisions = opened_doc.list_revisions()
         ids = [r.id for r in revisions]
         assert change_id not in ids
 
-        doc.close()
-
-    def test_reject_deletion_revision(self, clean_workspace):
+    def test_reject_deletion_revision(self, opened_doc):
         """Test rejecting a deletion restores the deleted text."""
-        doc = Document.open(clean_workspace)
+        ref = find_ref(opened_doc, "brown")
+        opened_doc.delete("brown", paragraph=ref)
 
-        ref = find_ref(doc, "brown")
-        doc.delete("brown", paragraph=ref)
-
-        revisions = doc.list_revisions()
+        revisions = opened_doc.list_revisions()
         change_id = revisions[-1].id
 
-        result = doc.reject_revision(change_id)
+        result = opened_doc.reject_revision(change_id)
         assert result is True
 
-        doc.close()
-
-    def test_reject_nonexistent_revision(self, clean_workspace):
+    def test_reject_nonexistent_revision(self, opened_doc):
         """Test rejecting a revision that doesn't exist."""
-        doc = Document.open(clean_workspace)
-
-        result = doc.reject_revision(99999)
+        result = opened_doc.reject_revision(99999)
         assert result is False
 
-        doc.close()
-
     def test_accept_all_by_author(self, clean_workspace):
         """Test accepting all revisions filtered by author."""
         doc = Document.open(clean_workspace, author="Author1")
@@ -663,35 +583,25 @@ class TestEscapeXml:
 class TestRevisionManagerErrorHandling:
     """Tests for error handling in RevisionManager."""
 
-    def test_replace_text_no_matches(self, clean_workspace):
+    def test_replace_text_no_matches(self, opened_doc):
         """Test document-wide replace raises error when no matches found."""
-        doc = Document.open(clean_workspace)
-
         with pytest.raises(TextNotFoundError) as exc_info:
-            doc._revision_manager.replace_text("nonexistent_xyz_123", "X")
+            opened_doc._revision_manager.replace_text("nonexistent_xyz_123", "X")
 
         assert "not found" in str(exc_info.value).lower()
 
-        doc.close()
-
-    def test_replace_text_occurrence_out_of_range(self, clean_workspace):
+    def test_replace_text_occurrence_out_of_range(self, opened_doc):
         """Test document-wide replace raises error for invalid occurrence."""
-        doc = Document.open(clean_workspace)
-
         # "Sample" exists once in the document
-        count = doc.count_matches("Sample")
-        if count == 0:
-            doc.close()
-            pytest.skip("Test text not found")
+        count = opened_doc.count_matches("Sample")
+        assert count == 1
 
         with pytest.raises(TextNotFoundError) as exc_info:
-            doc._revision_manager.replace_text("Sample", "X", occurrence=count + 10)
+            opened_doc._revision_manager.replace_text("Sample", "X", occurrence=count + 10)
 
         assert "occurrence" in str(exc_info.value).lower()
         assert exc_info.value.total_occurrences == count
 
-        doc.close()
-
 
 class TestRevisionManagerWithMockedEditor:
     """_parse_revision edge cases on real detached elements (editor mocked)."""
@@ -699,8 +609,6 @@ class TestRevisionManagerWithMockedEditor:
     @staticmethod
     def _revision_elem(xml: str):
         """Parse an XML fragment and return its first element (w:ins/w:del)."""
-        import defusedxml.minidom
-
         NS = 'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
         dom = defusedxml.minidom.parseString(f"<root {NS}>{xml}</root>")
         return dom.documentElement.firstChild
@@ -750,102 +658,82 @@ class TestRevisionManagerWithMockedEditor:
 class TestRestoreDeletionEdgeCases:
     """Tests for _restore_deletion edge cases."""
 
-    def test_reject_deletion_with_attributes(self, clean_workspace):
+    def test_reject_deletion_with_attributes(self, opened_doc):
         """Test rejecting deletion restores attributes on delText."""
-        doc = Document.open(clean_workspace)
-
         # Create a deletion
-        ref = find_ref(doc, "lazy")
-        doc.delete("lazy", paragraph=ref)
+        ref = find_ref(opened_doc, "lazy")
+        opened_doc.delete("lazy", paragraph=ref)
 
-        revisions = doc.list_revisions()
+        revisions = opened_doc.list_revisions()
         change_id = revisions[-1].id
 
         # Reject it to trigger _restore_deletion
-        result = doc.reject_revision(change_id)
+        result = opened_doc.reject_revision(change_id)
         assert result is True
 
-        doc.close()
-
-    def test_reject_deletion_handles_rsid_attributes(self, clean_workspace):
+    def test_reject_deletion_handles_rsid_attributes(self, opened_doc):
         """Test rejecting deletion converts rsidDel back to rsidR."""
-        doc = Document.open(clean_workspace)
-
         # Create a deletion
-        ref = find_ref(doc, "dog")
-        doc.delete("dog", paragraph=ref)
+        ref = find_ref(opened_doc, "dog")
+        opened_doc.delete("dog", paragraph=ref)
 
-        revisions = doc.list_revisions()
+        revisions = opened_doc.list_revisions()
         change_id = revisions[-1].id
 
         # Reject it
-        result = doc.reject_revision(change_id)
+        result = opened_doc.reject_revision(change_id)
         assert result is True
 
-        doc.close()
-
 
 class TestComplexOperations:
     """Tests for complex sequences of operations."""
 
-    def test_multiple_operations_same_paragraph(self, clean_workspace):
+    def test_multiple_operations_same_paragraph(self, opened_doc):
         """Test multiple tracked changes in the same paragraph."""
-        doc = Document.open(clean_workspace)
-
         # Find content in the paragraph "The quick brown fox..."
-        ref = find_ref(doc, "quick")
-        doc.delete("quick", paragraph=ref)
-        ref = find_ref(doc, "brown")
-        doc.insert_after("brown", " spotted", paragraph=ref)
-        ref = find_ref(doc, "fox")
-        doc.replace("fox", "cat", paragraph=ref)
-
-        revisions = doc.list_revisions()
+        ref = find_ref(opened_doc, "quick")
+        opened_doc.delete("quick", paragraph=ref)
+        ref = find_ref(opened_doc, "brown")
+        opened_doc.insert_after("brown", " spotted", paragraph=ref)
+        ref = find_ref(opened_doc, "fox")
+        opened_doc.replace("fox", "cat", paragraph=ref)
+
+        revisions = opened_doc.list_revisions()
         # Should have at least 3 revisions (1 delete, 1 insert, 2 from replace)
         assert len(revisions) >= 3
 
-        doc.close()
-
-    def test_accept_all_then_list(self, clean_workspace):
+    def test_accept_all_then_list(self, opened_doc):
         """Test that accept_all properly clears all revisions."""
-        doc = Document.open(clean_workspace)
-
-        ref = find_ref(doc, "quick")
-        doc.delete("quick", paragraph=ref)
-        ref = find_ref(doc, "fox")
-        doc.insert_after("fox", " test", paragraph=ref)
+        ref = find_ref(opened_doc, "quick")
+        opened_doc.delete("quick", paragraph=ref)
+        ref = find_ref(opened_doc, "fox")
+        opened_doc.insert_after("fox", " test", paragraph=ref)
 
-        initial_count = len(doc.list_revisions())
+        initial_count = len(opened_doc.list_revisions())
         assert initial_count >= 2
 
-        accepted = doc.accept_all()
+        accepted = opened_doc.accept_all()
         assert accepted == initial_count
 
-        remaining = doc.list_revisions()
+        remaining = opened_doc.list_revisions()
         assert len(remaining) == 0
 
-        doc.close()
-
-    def test_reject_all_then_list(self, clean_workspace):
+    def test_reject_all_then_list(self, opened_doc):
         """Test that reject_all properly clears all revisions."""
-        doc = Document.open(clean_workspace)
-
-        ref = find_ref(doc, "quick")
-        doc.delete("quick", paragraph=ref)
-        ref = find_ref(doc, "fox")
-        doc.insert_after("fox", " test", paragraph=ref)
+        ref = find_ref(opened_doc, "quick")
+        opened_doc.delete("quick", paragraph=ref)
+        ref = find_ref(opened_doc, "fox")
+        opened_doc.insert_after("fox", " test", paragraph=ref)
 
-        initial_count = len(doc.list_revisions())
+        initial_count = len(opened_doc.list_revisions())
         assert initial_count >= 2
 
-        rejected = doc.reject_all()
+        rejected = opened_doc.reject_all()
         assert rejected == initial_count
 
-        remaining = doc.list_revisions()
+        remaining = opened_doc.list_revisions()
         assert len(remaining) == 0
 
-        doc.close()
-
 
 class TestDocumentWideEditsRealXml:
     """Real-XML edge-case coverage for the unified document-wide edit path."""
@@ -926,27 +814,9 @@ class TestListRevisionsEdgeCases:
 
     def test_list_revisions_filters_by_author_for_insertions(self):
         """Test that list_revisions author filter works for insertions."""
-        mock_editor = MagicMock()
-        mock_editor.dom = MagicMock()
-
-        # Create mock insertion element
-        mock_ins = MagicMock()
-
-        def ins_get_attr(name):
-            if name == "w:id":
-                return "1"
-            elif name == "w:author":
-                return "SpecificAuthor"
-            elif name == "w:date":
-                return ""
-            return ""
-
-        mock_ins.getAttribute.side_effect = ins_get_attr
-        mock_ins.getElementsByTagName.return_value = []
-
-        mock_editor.dom.getElementsByTagName.side_effect = lambda tag: [mock_ins] if tag == "w:ins" else []
-
-        manager = RevisionManager(mock_editor)
+        manager = _make_revision_manager(
+            '<w:body><w:p><w:ins w:id="1" w:author="SpecificAuthor"><w:r><w:t>added</w:t></w:r></w:ins></w:p></w:body>'
+        )
 
         # Filter by matching author
         revisions = manager.list_revisions(author="SpecificAuthor")
@@ -959,27 +829,10 @@ class TestListRevisionsEdgeCases:
 
     def test_list_revisions_filters_by_author_for_deletions(self):
         """Test that list_revisions author filter works for deletions."""
-        mock_editor = MagicMock()
-        mock_editor.dom = MagicMock()
-
-        # Create mock deletion element
-        mock_del = MagicMock()
-
-        def del_get_attr(name):
-            if name == "w:id":
-                return "2"
-            elif name == "w:author":
-                return "DeleteAuthor"
-            elif name == "w:date":
-                return ""
-            return ""
-
-        mock_del.getAttribute.side_effect = del_get_attr
-        mock_del.getElementsByTagName.return_value = []
-
-        mock_editor.dom.getElementsByTagName.side_effect = lambda tag: [mock_del] if tag == "w:del" else []
-
-        manager = RevisionManager(mock_editor)
+        manager = _make_revision_manager(
+            '<w:body><w:p><w:del w:id="2" w:author="DeleteAuthor">'
+            "<w:r><w:delText>gone</w:delText></w:r></w:del></w:p></w:body>"
+        )
 
         # Filter by matching author
         revisions = manager.list_revisions(author="DeleteAuthor")
@@ -987,127 +840,239 @@ class TestListRevisionsEdgeCases:
         assert revisions[0].author == "DeleteAuthor"
         assert revisions[0].type == "deletion"
 
+    def test_list_revisions_single_walk_sorted_by_id(self, monkeypatch):
+        """Insertions and deletions come from one DOM walk, still sorted by id."""
+        manager = _make_revision_manager(
+            "<w:body><w:p>"
+            '<w:del w:id="7" w:author="A"><w:r><w:delText>old</w:delText></w:r></w:del>'
+            '<w:ins w:id="3" w:author="A"><w:r><w:t>new</w:t></w:r></w:ins>'
+            '<w:ins w:id="5" w:author="B"><w:r><w:t>more</w:t></w:r>'
+            '<w:del w:id="4" w:author="A"><w:r><w:delText>x</w:delText></w:r></w:del>'
+            "</w:ins>"
+            "</w:p></w:body>"
+        )
+        walks = count_dom_walks(monkeypatch)
+
+        revisions = manager.list_revisions(with_location=False)
+
+        assert [(r.id, r.type) for r in revisions] == [
+            (3, "insertion"),
+            (4, "deletion"),
+            (5, "insertion"),
+            (7, "deletion"),
+        ]
+        assert walks == []
+
+    def test_author_filter_skips_parsing_other_authors(self, monkeypatch):
+        """Other authors' revisions are filtered before _parse_revision runs."""
+        manager = _make_revision_manager(
+            "<w:body><w:p>"
+            '<w:ins w:id="1" w:author="A"><w:r><w:t>a</w:t></w:r></w:ins>'
+            '<w:ins w:id="2" w:author="B"><w:r><w:t>b</w:t></w:r></w:ins>'
+            '<w:del w:id="3"><w:r><w:delText>c</w:delText></w:r></w:del>'
+            "</w:p></w:body>"
+        )
+        parsed = []
+        real_parse = manager._parse_revision
+
+        def counting_parse(elem, *args, **kwargs):
+            parsed.append(elem.getAttribute("w:id"))
+            return real_parse(elem, *args, **kwargs)
+
+        monkeypatch.setattr(manager, "_parse_revision", counting_parse)
+
+        assert [r.id for r in manager.list_revisions(author="A")] == [1]
+        assert parsed == ["1"]
+        assert [r.id for r in manager.list_revisions(author="Unknown")] == [3]
+
 
 class TestAcceptRejectLoops:
     """Tests for accept_all and reject_all loops."""
 
     def test_accept_all_processes_multiple_revisions(self):
         """Test that accept_all correctly processes multiple revisions."""
-        mock_editor = MagicMock()
-        mock_editor.dom = MagicMock()
-
-        # Create two mock insertions
-        mock_ins1 = MagicMock()
-        mock_ins2 = MagicMock()
-
-        def ins1_get_attr(name):
-            if name == "w:id":
-                return "1"
-            elif name == "w:author":
-                return "Author"
-            return ""
-
-        def ins2_get_attr(name):
-            if name == "w:id":
-                return "2"
-            elif name == "w:author":
-                return "Author"
-            return ""
-
-        mock_ins1.getAttribute.side_effect = ins1_get_attr
-        mock_ins1.getElementsByTagName.return_value = []
-        mock_ins1.parentNode = MagicMock()
-
-        mock_ins2.getAttribute.side_effect = ins2_get_attr
-        mock_ins2.getElementsByTagName.return_value = []
-        mock_ins2.parentNode = MagicMock()
-
-        # Track which elements have been processed
-        processed = set()
-
-        def get_elements(tag):
-            if tag == "w:ins":
-                result = []
-                if "1" not in processed:
-                    result.append(mock_ins1)
-                if "2" not in processed:
-                    result.append(mock_ins2)
-                return result
-            return []
-
-        mock_editor.dom.getElementsByTagName.side_effect = get_elements
-
-        manager = RevisionManager(mock_editor)
-
-        # Mock accept_revision to track calls
-        def mock_accept(rev_id: int) -> bool:
-            processed.add(str(rev_id))
-            return True
-
-        manager.accept_revision = mock_accept  # type: ignore[method-assign]
+        manager = _make_revision_manager(
+            "<w:body><w:p>"
+            '<w:ins w:id="1" w:author="Author"><w:r><w:t>one</w:t></w:r></w:ins>'
+            '<w:ins w:id="2" w:author="Author"><w:r><w:t>two</w:t></w:r></w:ins>'
+            "</w:p></w:body>"
+        )
 
         count = manager.accept_all()
         assert count == 2
+        assert manager.list_revisions() == []
+        texts = [t.firstChild.data for t in manager.editor.dom.getElementsByTagName("w:t")]
+        assert texts == ["one", "two"]
 
     def test_reject_all_processes_multiple_revisions(self):
         """Test that reject_all correctly processes multiple revisions."""
-        mock_editor = MagicMock()
-        mock_editor.dom = MagicMock()
-
-        # Create two mock deletions
-        mock_del1 = MagicMock()
-        mock_del2 = MagicMock()
-
-        def del1_get_attr(name):
-            if name == "w:id":
-                return "3"
-            elif name == "w:author":
-                return "Author"
-            return ""
-
-        def del2_get_attr(name):
-            if name == "w:id":
-                return "4"
-            elif name == "w:author":
-                return "Author"
-            return ""
-
-        mock_del1.getAttribute.side_effect = del1_get_attr
-        mock_del1.getElementsByTagName.return_value = []
-
-        mock_del2.getAttribute.side_effect = del2_get_attr
-        mock_del2.getElementsByTagName.return_value = []
-
-        processed = set()
-
-        def get_elements(tag):
-            if tag == "w:del":
-                result = []
-                if "3" not in processed:
-                    result.append(mock_del1)
-                if "4" not in processed:
-                    result.append(mock_del2)
-                return result
-            return []
-
-        mock_editor.dom.getElementsByTagName.side_effect = get_elements
+        manager = _make_revision_manager(
+            "<w:body><w:p>"
+            '<w:del w:id="3" w:author="Author"><w:r><w:delText>three</w:delText></w:r></w:del>'
+            '<w:del w:id="4" w:author="Author"><w:r><w:delText>four</w:delText></w:r></w:del>'
+            "</w:p></w:body>"
+        )
 
-        manager = RevisionManager(mock_editor)
+        count = manager.reject_all()
+        assert count == 2
+        assert manager.list_revisions() == []
+        texts = [t.firstChild.data for t in manager.editor.dom.getElementsByTagName("w:t")]
+        assert texts == ["three", "four"]
+
+    @pytest.mark.parametrize("method", ["accept_all", "reject_all"])
+    def test_bulk_resolution_walks_once(self, monkeypatch, method):
+        """accept_all/reject_all walk the document once, without parsing Revisions."""
+        revisions = "".join(
+            f'<w:ins w:id="{i}" w:author="Author"><w:r><w:t>i{i}</w:t></w:r></w:ins>'
+            f'<w:del w:id="{i + 100}" w:author="Author"><w:r><w:delText>d{i}</w:delText></w:r></w:del>'
+            for i in range(1, 11)
+        )
+        manager = _make_revision_manager(f"<w:body><w:p>{revisions}</w:p></w:body>")
+        passes = []
+        original = track_changes._revision_elements
 
-        def mock_reject(rev_id: int) -> bool:
-            processed.add(str(rev_id))
-            return True
+        def recording(root):
+            passes.append(root)
+            return original(root)
 
-        manager.reject_revision = mock_reject  # type: ignore[method-assign]
+        monkeypatch.setattr(track_changes, "_revision_elements", recording)
+        monkeypatch.setattr(manager, "_parse_revision", MagicMock(side_effect=AssertionError("parsed")))
+        walks = count_dom_walks(monkeypatch)
 
-        count = manager.reject_all()
-        assert count == 2
+        assert getattr(manager, method)() == 20
+
+        # Every listed id resolved in the first pass, so no confirming re-walk
+        assert len(passes) == 1
+        assert walks == []
+        monkeypatch.undo()
+        assert manager.list_revisions() == []
+
+    def test_standalone_lookup_prefers_insertion_without_full_sweeps(self, monkeypatch):
+        """A standalone accept finds its element lazily; a w:ins wins over a w:del with the same id."""
+        manager = _make_revision_manager(
+            "<w:body><w:p>"
+            '<w:del w:id="9" w:author="Author"><w:r><w:delText>old</w:delText></w:r></w:del>'
+            '<w:ins w:id="9" w:author="Author"><w:r><w:t>new</w:t></w:r></w:ins>'
+            "</w:p></w:body>"
+        )
+        walks = count_dom_walks(monkeypatch)
+
+        assert manager.accept_revision(9) is True
+
+        assert walks == []
+        assert manager.editor.dom.getElementsByTagName("w:ins").length == 0
+        assert manager.editor.dom.getElementsByTagName("w:del").length == 1
+
+    def test_standalone_deletion_lookup_walks_once(self, monkeypatch):
+        """Finding a w:del takes one walk, not an insertion sweep followed by a deletion sweep."""
+        manager = _make_revision_manager(
+            "<w:body><w:p>"
+            '<w:ins w:id="1" w:author="Author"><w:r><w:t>new</w:t></w:r></w:ins>'
+            '<w:del w:id="2" w:author="Author"><w:r><w:delText>old</w:delText></w:r></w:del>'
+            "</w:p></w:body>"
+        )
+        walks = []
+        real_iter = track_changes.iter_elements
+        monkeypatch.setattr(track_changes, "iter_elements", lambda root, tag: walks.append(tag) or real_iter(root, tag))
+
+        assert manager.reject_revision(2) is True
+        assert manager.reject_revision(3) is False
+
+        assert walks == ["*", "*"]
+        assert manager.editor.dom.getElementsByTagName("w:t")[-1].firstChild.data == "old"
+
+    def test_accept_revisions_indexes_once_and_resolves_nested(self, monkeypatch):
+        """An id list resolves through one index, nested members included, skipping unknown ids."""
+        manager = _make_revision_manager(
+            "<w:body><w:p>"
+            '<w:ins w:id="1" w:author="A"><w:r><w:t>keep </w:t></w:r>'
+            '<w:del w:id="2" w:author="B"><w:r><w:delText>gone</w:delText></w:r></w:del>'
+            "</w:ins>"
+            '<w:ins w:id="3" w:author="A"><w:r><w:t> untouched</w:t></w:r></w:ins>'
+            "</w:p></w:body>"
+        )
+        index_walks = []
+        original = track_changes._revision_elements
+
+        def recording(root):
+            index_walks.append(root)
+            return original(root)
+
+        monkeypatch.setattr(track_changes, "_revision_elements", recording)
+        walks = count_dom_walks(monkeypatch)
+
+        assert manager.accept_revisions([1, 2, 99]) == 2
+
+        # One _revision_index walk, and no per-id document scan
+        assert len(index_walks) == 1
+        assert walks == []
+        monkeypatch.undo()
+        assert [r.id for r in manager.list_revisions()] == [3]
+        assert [t.firstChild.data for t in manager.editor.dom.getElementsByTagName("w:t")] == ["keep ", " untouched"]
+
+    def test_reject_revisions_matches_per_id_rejects(self):
+        """reject_revisions leaves the same document as rejecting each id in turn."""
+        body = (
+            "<w:body><w:p>"
+            '<w:ins w:id="1" w:author="A"><w:r><w:t>new</w:t></w:r></w:ins>'
+            '<w:del w:id="2" w:author="A"><w:r><w:delText>old</w:delText></w:r></w:del>'
+            '<w:ins w:id="3" w:author="A"><w:r><w:t>kept</w:t></w:r></w:ins>'
+            "</w:p></w:body>"
+        )
+        batched = _make_revision_manager(body)
+        one_by_one = _make_revision_manager(body)
+
+        assert batched.reject_revisions([1, 2]) == 2
+        assert [one_by_one.reject_revision(rev_id) for rev_id in (2, 1)] == [True, True]
+
+        assert batched.editor.dom.toxml() == one_by_one.editor.dom.toxml()
+        assert batched.reject_revisions([1, 2]) == 0
+
+    @pytest.mark.parametrize(
+        "method, single",
+        [("accept_revisions", "accept_revision"), ("reject_revisions", "reject_revision")],
+    )
+    def test_duplicate_ids_match_per_id_calls(self, method, single):
+        """A w:id Word duplicated resolves once per listing, exactly like per-id calls."""
+        body = (
+            "<w:body><w:p>"
+            '<w:ins w:id="5" w:author="A"><w:r><w:t>one</w:t></w:r></w:ins>'
+            "<w:r><w:t> mid </w:t></w:r>"
+            '<w:ins w:id="5" w:author="A"><w:r><w:t>two</w:t></w:r></w:ins>'
+            '<w:del w:id="7" w:author="A"><w:r><w:delText>old</w:delText></w:r></w:del>'
+            "</w:p></w:body>"
+        )
+        batched = _make_revision_manager(body)
+        one_by_one = _make_revision_manager(body)
+        ids = [r.id for r in batched.list_revisions()]
+        assert sorted(ids) == [5, 5, 7]
+
+        assert getattr(batched, method)(ids) == 3
+        assert [getattr(one_by_one, single)(rev_id) for rev_id in ids] == [True, True, True]
+
+        assert batched.list_revisions() == []
+        assert batched.editor.dom.toxml() == one_by_one.editor.dom.toxml()
+
+    def test_duplicate_id_listed_once_resolves_one_copy(self):
+        """Listing a duplicated id once resolves one copy, as one accept_revision call does."""
+        body = (
+            "<w:body><w:p>"
+            '<w:ins w:id="5" w:author="A"><w:r><w:t>one</w:t></w:r></w:ins>'
+            '<w:ins w:id="5" w:author="A"><w:r><w:t>two</w:t></w:r></w:ins>'
+            "</w:p></w:body>"
+        )
+        batched = _make_revision_manager(body)
+        one_by_one = _make_revision_manager(body)
+
+        assert batched.accept_revisions([5]) == 1
+        assert one_by_one.accept_revision(5) is True
+
+        assert len(batched.list_revisions()) == 1
+        assert batched.editor.dom.toxml() == one_by_one.editor.dom.toxml()
 
 
 def _make_revision_manager(body_xml):
     """Build a RevisionManager over a real minidom DOM from a body snippet."""
-    import defusedxml.minidom
-
     xml = (
         '<?xml version="1.0"?>'
         '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
@@ -1284,14 +1249,32 @@ class TestRestoreDeletionAttributeCopying:
         assert r_elems[0].getAttribute("w:rsidR") == "00112233"
         assert not r_elems[0].hasAttribute("w:rsidDel")
 
+    def test_restore_deletion_renames_deltext_in_place(self):
+        """w:delText becomes w:t without a replacement element being created."""
+        manager = _make_revision_manager(
+            """
+            <w:del w:id="1" w:author="Test">
+                <w:r><w:delText xml:space="preserve">one </w:delText></w:r>
+                <w:r><w:tab/><w:delText>two</w:delText></w:r>
+            </w:del>"""
+        )
+        dom = manager.editor.dom
+        originals = dom.getElementsByTagName("w:delText")
+
+        manager._restore_deletion(dom.getElementsByTagName("w:del")[0])
+
+        t_elems = dom.getElementsByTagName("w:t")
+        assert [t is o for t, o in zip(t_elems, originals, strict=True)] == [True, True]
+        assert [t.firstChild.data for t in t_elems] == ["one ", "two"]
+        assert t_elems[1].previousSibling.tagName == "w:tab"
+        assert dom.getElementsByTagName("w:delText") == []
+
 
 class TestParseRevisionDelTextFallback:
     """Tests for w:delText -> w:t fallback when reading deletion text."""
 
     def test_deletion_with_plain_wt_falls_back(self):
         """Test that deletion text falls back to w:t when w:delText is absent."""
-        import defusedxml.minidom
-
         # Nonconforming producers may leave plain w:t inside w:del
         xml = """<?xml version="1.0"?>
         <w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">
@@ -1314,8 +1297,6 @@ class TestParseRevisionDelTextFallback:
 
     def test_deletion_with_deltext_unchanged(self):
         """Test that the fallback does not fire when w:delText exists."""
-        import defusedxml.minidom
-
         xml = """<?xml version="1.0"?>
         <w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">
             <w:del w:id="1" w:author="Test">
@@ -1337,6 +1318,26 @@ class TestParseRevisionDelTextFallback:
         assert len(revisions) == 1
         assert revisions[0].text == "proper"
 
+    def test_deletion_text_read_in_one_walk(self, monkeypatch):
+        """The fallback reuses the single text-node walk instead of re-walking for w:t."""
+        manager = _make_revision_manager(
+            '<w:del w:id="1" w:author="Foreign"><w:r><w:t>lost</w:t></w:r><w:r><w:t> text</w:t></w:r></w:del>'
+        )
+        del_elem = manager.editor.dom.getElementsByTagName("w:del")[0]
+        walks = []
+        original = track_changes._revision_text_nodes
+
+        def recording(elem):
+            walks.append(elem)
+            return original(elem)
+
+        monkeypatch.setattr(track_changes, "_revision_text_nodes", recording)
+
+        revision = manager._parse_revision(del_elem, "deletion")
+
+        assert revision.text == "lost text"
+        assert walks == [del_elem]
+
 
 def _split_wt_text_nodes(doc, target_text, tag="w:t"):
     """Reach into the DOM and split an element's TEXT_NODE into multiple siblings.
@@ -1368,73 +1369,62 @@ class TestMultiTextNodeWtElements:
     """Issue #9: w:t elements with multiple TEXT_NODE children (smart-quote split)."""
 
     # Both the document-wide (paragraph=None) and paragraph-scoped paths route
-    # through the text-map helpers, which read node text via _get_node_text and
+    # through the text-map helpers, which read node text via get_text_node_data and
     # so tolerate w:t elements whose text is split across TEXT_NODE children.
 
-    def test_set_node_text_consolidates_split_nodes(self, clean_workspace):
+    def test_set_node_text_consolidates_split_nodes(self, opened_doc):
         """Direct contract test for _set_node_text: starts from a multi-TEXT_NODE
         state, ends with exactly one TEXT_NODE carrying the full new content.
         Guards against future "simplifications" that would re-introduce the
         firstChild.data assignment pattern."""
-        doc = Document.open(clean_workspace)
-        wt = _split_wt_text_nodes(doc, "quick brown fox")
+        wt = _split_wt_text_nodes(opened_doc, "quick brown fox")
         text_nodes_before = [c for c in wt.childNodes if c.nodeType == c.TEXT_NODE]
         assert len(text_nodes_before) > 1
 
-        doc._revision_manager._set_node_text(wt, "consolidated")
+        opened_doc._revision_manager._set_node_text(wt, "consolidated")
 
         text_nodes_after = [c for c in wt.childNodes if c.nodeType == c.TEXT_NODE]
         assert len(text_nodes_after) == 1
         assert text_nodes_after[0].data == "consolidated"
-        doc.close()
 
-    def test_replace_without_paragraph_arg_succeeds(self, clean_workspace):
-        doc = Document.open(clean_workspace)
-        wt = _split_wt_text_nodes(doc, "quick brown fox")
+    def test_replace_without_paragraph_arg_succeeds(self, opened_doc):
+        wt = _split_wt_text_nodes(opened_doc, "quick brown fox")
         assert len(wt.childNodes) > 1
-        doc._revision_manager.replace_text("quick brown fox", "slow red turtle")
-        paragraphs = doc.list_paragraphs()
+        opened_doc._revision_manager.replace_text("quick brown fox", "slow red turtle")
+        paragraphs = opened_doc.list_paragraphs()
         assert any("slow red turtle" in p for p in paragraphs)
         assert not any("quick brown fox" in p for p in paragraphs)
-        doc.close()
 
-    def test_delete_without_paragraph_arg_succeeds(self, clean_workspace):
-        doc = Document.open(clean_workspace)
-        _split_wt_text_nodes(doc, "quick brown fox")
-        doc._revision_manager.suggest_deletion("quick brown fox")
-        paragraphs = doc.list_paragraphs()
+    def test_delete_without_paragraph_arg_succeeds(self, opened_doc):
+        _split_wt_text_nodes(opened_doc, "quick brown fox")
+        opened_doc._revision_manager.suggest_deletion("quick brown fox")
+        paragraphs = opened_doc.list_paragraphs()
         assert not any("quick brown fox" in p for p in paragraphs)
-        doc.close()
 
-    def test_insert_without_paragraph_arg_succeeds(self, clean_workspace):
-        doc = Document.open(clean_workspace)
-        ref = find_ref(doc, "lazy dog")
-        doc.insert_before("lazy dog", "INS_TARGET ", paragraph=ref)
-        _split_wt_text_nodes(doc, "INS_TARGET")
-        doc._revision_manager.insert_text_before("INS_TARGET", "X_")
-        paragraphs = doc.list_paragraphs()
+    def test_insert_without_paragraph_arg_succeeds(self, opened_doc):
+        ref = find_ref(opened_doc, "lazy dog")
+        opened_doc.insert_before("lazy dog", "INS_TARGET ", paragraph=ref)
+        _split_wt_text_nodes(opened_doc, "INS_TARGET")
+        opened_doc._revision_manager.insert_text_before("INS_TARGET", "X_")
+        paragraphs = opened_doc.list_paragraphs()
         assert any("X_INS_TARGET" in p for p in paragraphs)
-        doc.close()
 
-    def test_replace_inside_ins_writes_full_text(self, clean_workspace):
+    def test_replace_inside_ins_writes_full_text(self, opened_doc):
         # Hits _replace_across_nodes' "all inside ins" path which previously
         # used firstChild.data assignment.
-        doc = Document.open(clean_workspace)
-        ref = find_ref(doc, "lazy dog")
-        ref = doc.insert_before("lazy dog", "INS_TARGET ", paragraph=ref)
-        _split_wt_text_nodes(doc, "INS_TARGET")
-        doc.replace("INS_TARGET", "REPLACED", paragraph=ref)
-        paragraphs = doc.list_paragraphs()
+        ref = find_ref(opened_doc, "lazy dog")
+        ref = opened_doc.insert_before("lazy dog", "INS_TARGET ", paragraph=ref)
+        _split_wt_text_nodes(opened_doc, "INS_TARGET")
+        opened_doc.replace("INS_TARGET", "REPLACED", paragraph=ref)
+        paragraphs = opened_doc.list_paragraphs()
         assert any("REPLACED" in p for p in paragraphs)
         assert not any("INS_TARGET" in p for p in paragraphs)
-        doc.close()
 
-    def test_list_revisions_with_multi_text_node_delText(self, clean_workspace):
-        doc = Document.open(clean_workspace)
-        ref = find_ref(doc, "quick brown fox")
-        doc.delete("quick brown fox", paragraph=ref)
+    def test_list_revisions_with_multi_text_node_delText(self, opened_doc):
+        ref = find_ref(opened_doc, "quick brown fox")
+        opened_doc.delete("quick brown fox", paragraph=ref)
 
-        dom = doc._document_editor.dom
+        dom = opened_doc._document_editor.dom
         del_texts = dom.getElementsByTagName("w:delText")
         assert del_texts, "expected at least one w:delText after delete"
         elem = del_texts[0]
@@ -1445,11 +1435,10 @@ class TestMultiTextNodeWtElements:
         elem.appendChild(elem.ownerDocument.createTextNode(full[:mid]))
         elem.appendChild(elem.ownerDocument.createTextNode(full[mid:]))
 
-        revisions = doc.list_revisions()
+        revisions = opened_doc.list_revisions()
         deletions = [r for r in revisions if r.type == "deletion"]
         assert deletions
         assert deletions[0].text == full
-        doc.close()
 
     def test_save_load_roundtrip_after_multi_node_edit(self, clean_workspace, tmp_path):
         doc = Document.open(clean_workspace)
@@ -1473,11 +1462,6 @@ def _build_smart_quote_docx(simple_docx, dest):
     U+2018/U+2019 smart quotes, simulating the structure reported in
     GitHub issue #9.
     """
-    import shutil
-
-    from docx_editor.ooxml.pack import pack_document
-    from docx_editor.ooxml.unpack import unpack_document
-
     work = dest.parent / "_smart_quote_build"
     if work.exists():
         shutil.rmtree(work)
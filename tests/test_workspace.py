@@ -11,7 +11,7 @@ import sys
 from pathlib import Path
 
 import pytest
-from conftest import ENTITY_DTD_XML, find_ref, replace_document_xml, replace_docx_parts
+from conftest import ENTITY_DTD_XML, find_ref, replace_document_xml, replace_docx_parts, touch_externally
 
 from docx_editor.document import Document
 from docx_editor.exceptions import (
@@ -157,10 +157,11 @@ class TestWorkspaceMissingDocumentXml:
 
         orphan = Workspace._resolve_workspace_path(junk.resolve(), None)
         orphan.mkdir(parents=True)
+        junk_stat = junk.stat()
         meta = {
             "source_path": str(junk.resolve()),
-            "source_mtime": junk.stat().st_mtime,
-            "source_size": junk.stat().st_size,
+            "source_mtime": junk_stat.st_mtime,
+            "source_size": junk_stat.st_size,
             "source_sha256": _file_sha256(junk),
             "dirty": False,
         }
@@ -202,11 +203,8 @@ class TestWorkspacePersistence:
         workspace = Workspace(clean_workspace)
         workspace.close(cleanup=False)
 
-        # Modify the source document
-        import time
-
-        time.sleep(0.1)  # Ensure mtime changes
-        clean_workspace.write_bytes(clean_workspace.read_bytes() + b"\x00")
+        # Modify the source document (the size change alone makes it stale)
+        touch_externally(clean_workspace)
 
         # Should raise sync error
         with pytest.raises(WorkspaceSyncError):
@@ -372,14 +370,11 @@ class TestWorkspaceEdgeCases:
 
     def test_sync_check_source_modified(self, clean_workspace):
         """Test sync_check returns False when source is modified."""
-        import time
-
         workspace = Workspace(clean_workspace)
         workspace.close(cleanup=False)
 
-        # Modify the source
-        time.sleep(0.1)
-        clean_workspace.write_bytes(clean_workspace.read_bytes() + b"\x00")
+        # Modify the source (the size change alone makes it stale)
+        touch_externally(clean_workspace)
 
         # Reopen without creating new workspace
         workspace2 = Workspace.__new__(Workspace)
@@ -574,16 +569,13 @@ class TestWorkspaceLocation:
 
     def test_sync_error_message_contains_workspace_path(self, temp_docx, tmp_path, monkeypatch):
         """WorkspaceSyncError from the cache location prints the workspace path."""
-        import time
-
         monkeypatch.setenv("DOCX_EDITOR_WORKSPACE_DIR", str(tmp_path))
         workspace = Workspace(temp_docx)
         workspace_path = workspace.workspace_path
         workspace.close(cleanup=False)
 
-        # Modify the source so the mtime check fails on reopen.
-        time.sleep(0.1)
-        temp_docx.write_bytes(temp_docx.read_bytes() + b"\x00")
+        # Modify the source so the staleness check fails on reopen.
+        touch_externally(temp_docx)
 
         with pytest.raises(WorkspaceSyncError, match=re.escape(str(workspace_path))):
             Workspace(temp_docx)
@@ -698,7 +690,7 @@ class TestSaveStaleness:
     def test_save_raises_when_source_changed_externally(self, temp_docx):
         ws = Workspace(temp_docx, author="Test")
         # Simulate an external edit: change the source file's content.
-        temp_docx.write_bytes(temp_docx.read_bytes() + b"\x00")
+        touch_externally(temp_docx)
         try:
             with pytest.raises(WorkspaceSyncError, match="changed on disk"):
                 ws.save()
@@ -707,7 +699,7 @@ class TestSaveStaleness:
 
     def test_save_force_overwrites_changed_source(self, temp_docx):
         ws = Workspace(temp_docx, author="Test")
-        temp_docx.write_bytes(temp_docx.read_bytes() + b"\x00")
+        touch_externally(temp_docx)
         try:
             result = ws.save(force=True)
             assert result == temp_docx.resolve()
@@ -718,7 +710,7 @@ class TestSaveStaleness:
 
     def test_save_to_other_destination_ignores_stale_source(self, temp_docx, temp_dir):
         ws = Workspace(temp_docx, author="Test")
-        temp_docx.write_bytes(temp_docx.read_bytes() + b"\x00")
+        touch_externally(temp_docx)
         try:
             out = ws.save(destination=temp_dir / "elsewhere.docx")
             assert out.exists()
@@ -747,6 +739,29 @@ class TestSaveStaleness:
         finally:
             ws.close()
 
+    def test_is_source_recognises_hardlink_and_fresh_path(self, temp_docx, temp_dir):
+        """_is_source() matches a hardlink to the source and rejects a fresh path."""
+        ws = Workspace(temp_docx, author="Test")
+        link = temp_dir / "hardlink.docx"
+        os.link(temp_docx, link)
+        try:
+            assert ws._is_source(link) is True
+            assert ws._is_source(temp_dir / "fresh.docx") is False
+        finally:
+            ws.close()
+
+    def test_sync_check_source_symlink_loop_is_out_of_sync(self, temp_docx, temp_dir):
+        """A source that can no longer be stat()ed (here ELOOP) reads as out of sync, not an error."""
+        ws = Workspace(temp_docx, author="Test")
+        try:
+            temp_docx.unlink()
+            other = temp_dir / "loop.docx"
+            other.symlink_to(temp_docx)
+            temp_docx.symlink_to(other)
+            assert ws.sync_check() is False
+        finally:
+            ws.close()
+
     def test_reopen_is_consistent_with_save_staleness(self, temp_docx):
         """__init__ and save() must share one staleness predicate.
 
@@ -996,7 +1011,7 @@ class TestWorkspaceLock:
         locks itself out of its own retry/rescue."""
         ws = Workspace(temp_docx, author="Test")
         ws.close(cleanup=False)
-        temp_docx.write_bytes(temp_docx.read_bytes() + b"\x00")  # now stale
+        touch_externally(temp_docx)  # now stale
 
         # Were the lock leaked by the first failure, the second attempt would
         # raise WorkspaceLockedError instead of the real, actionable error.
@@ -10,6 +10,7 @@ from docx_editor.xml_editor import (
     _generate_hex_id,
     _generate_rsid,
     get_rPr_xml,
+    get_text_node_data,
     render_plain_wt,
 )
 
@@ -248,6 +249,27 @@ class TestXMLEditorFindAllNodes:
         nodes = editor.find_all_nodes("w:t", contains="Hello")
         assert len(nodes) == 1
 
+    def test_iter_nodes_matches_document_order(self, sample_xml_file):
+        """iter_nodes yields the same elements, in order, as a full tag sweep."""
+        editor = XMLEditor(sample_xml_file)
+        for tag in ("w:t", "w:p", "*"):
+            assert list(editor.iter_nodes(tag)) == list(editor.dom.getElementsByTagName(tag))
+
+    def test_iter_nodes_is_lazy(self, sample_xml_file, monkeypatch):
+        """Taking the first match does not text-filter the rest of the document."""
+        editor = XMLEditor(sample_xml_file)
+        checked = []
+        original = editor._get_element_text
+
+        def recording(elem):
+            checked.append(elem)
+            return original(elem)
+
+        monkeypatch.setattr(editor, "_get_element_text", recording)
+        first = next(editor.iter_nodes("w:t", contains="Hello"))
+        assert checked == [first]
+        assert first is editor.dom.getElementsByTagName("w:t")[0]
+
 
 class TestXMLEditorGetElementText:
     """Tests for XMLEditor._get_element_text method."""
@@ -894,6 +916,28 @@ class TestRunFragmentHelpers:
         assert render_plain_wt(wt, "") == ["<w:r><w:t>a &amp; b &lt; c</w:t></w:r>"]
 
 
+class TestGetTextNodeData:
+    """Tests for get_text_node_data."""
+
+    def test_single_text_child(self):
+        wt = _parse_run("<w:r><w:t>hello</w:t></w:r>").getElementsByTagName("w:t")[0]
+        assert get_text_node_data(wt) == "hello"
+
+    def test_empty_element(self):
+        wt = _parse_run("<w:r><w:t></w:t></w:r>").getElementsByTagName("w:t")[0]
+        assert get_text_node_data(wt) == ""
+
+    def test_split_text_children_are_joined(self):
+        """Issue #9: minidom may split one w:t's text across TEXT_NODEs."""
+        wt = _parse_run("<w:r><w:t>it</w:t></w:r>").getElementsByTagName("w:t")[0]
+        wt.appendChild(wt.ownerDocument.createTextNode("\u2019s"))
+        assert get_text_node_data(wt) == "it\u2019s"
+
+    def test_lone_element_child_is_not_text(self):
+        run = _parse_run("<w:r><w:tab/></w:r>")
+        assert get_text_node_data(run) == ""
+
+
 class TestDocxXMLEditorAttributeInjectionExtended:
     """Extended tests for attribute injection covering more edge cases."""
 